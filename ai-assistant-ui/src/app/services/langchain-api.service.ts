@@ -165,9 +165,14 @@ export class LangchainApiService {
                   message.toolCalls = [];
                 }
                 message.toolCalls.push(chunk.toolCall);
-              } else if (chunk.type === 'content') {
+              } else if (chunk.type === 'content' || chunk.type === 'delta') {
+                // 'content' replaces the text, 'delta' appends to it
+                const content = chunk.type === 'delta'
+                  ? message.content + (chunk.content || '')
+                  : chunk.content || '';
+
                 // Create a new message object to trigger change detection
-                const updatedMessage = { ...message, content: chunk.content || '' };
+                const updatedMessage = { ...message, content };
                 const messageIndex = conversation.messages.findIndex(m => m.id === message.id);
                 if (messageIndex !== -1) {
                   conversation.messages[messageIndex] = updatedMessage;
@@ -9,15 +9,30 @@ from typing import Any
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
+from langchain_core.messages import AIMessage
 from pathlib import Path
-import json
+import asyncio
+import hashlib
+import logging
 from dotenv import load_dotenv
+import orjson
 import uvicorn
 
 # Local imports
 from src.core.utils import setup_logging
 from src.core.agent import initialize_agent_components
-from src.core.config import LOG_KEEP_RECENT, ENABLE_RAGAS_COLLECTION, RAGAS_DATA_DIR
+from src.core.cache import TTLCache
+from src.core.config import (
+    LOG_KEEP_RECENT,
+    ENABLE_RAGAS_COLLECTION,
+    RAGAS_DATA_DIR,
+    CHAT_CACHE_SIZE,
+    CHAT_CACHE_TTL,
+    CHAT_CACHEABLE_TOOLS,
+    API_HOST,
+    API_PORT,
+    API_WORKERS,
+)
 from src.models import ChatMessage, ChatRequest
 from src.observability import RagasDataCollector
 from datetime import datetime
@@ -33,6 +48,19 @@ load_dotenv()
 
 app = FastAPI(title="MSI AI Assistant API")
 
+
+def sse_event(data: dict[str, Any]) -> bytes:
+    """Encode a server-sent event frame"""
+    return b"data: " + orjson.dumps(data) + b"\n\n"
+
+
+# Constant frames are encoded once at import time; the hot-path frames are
+# templates so only the variable part is serialized per event
+DONE_EVENT = sse_event({"type": "done"})
+TOOL_CALL_EVENT = b'data: {"type":"tool_call","toolCall":%s}\n\n'
+CONTENT_EVENT = b'data: {"type":"content","content":%s}\n\n'
+DELTA_EVENT = b'data: {"type":"delta","content":%s}\n\n'
+
 # Enable CORS for Angular dev server
 app.add_middleware(
     CORSMiddleware,
@@ -52,6 +80,9 @@ async def startup_event() -> None:
         logger=logger
     )
     logger.info("Agent initialization complete")
+
+    # Cache for repeated /api/chat conversations
+    app.state.chat_cache = TTLCache(maxsize=CHAT_CACHE_SIZE, ttl=CHAT_CACHE_TTL)
     
     # Initialize Ragas data collector if enabled
     if ENABLE_RAGAS_COLLECTION:
@@ -63,8 +94,12 @@ async def startup_event() -> None:
         data_dir = PROJECT_ROOT / RAGAS_DATA_DIR
         data_dir.mkdir(parents=True, exist_ok=True)
         
+        # Every save appends to one JSON Lines file per server run
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        app.state.collector_file = data_dir / f"agent_data_{timestamp}.jsonl"
+        
         logger.info(f"Ragas data collection enabled. Auto-save every {app.state.auto_save_interval} interactions.")
-        logger.info(f"Data will be saved to {data_dir}")
+        logger.info(f"Data will be saved to {app.state.collector_file}")
     else:
         app.state.collector = None
         logger.info("Ragas data collection disabled")
@@ -73,17 +108,58 @@ async def startup_event() -> None:
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
     """Save any remaining collected data on shutdown"""
+    # Let in-flight auto-saves finish first
+    if background_tasks:
+        await asyncio.gather(*background_tasks, return_exceptions=True)
+
     if hasattr(app.state, 'collector') and app.state.collector is not None:
         try:
             if len(app.state.collector) > 0:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                data_file = PROJECT_ROOT / RAGAS_DATA_DIR / f"agent_data_{timestamp}.json"
-                app.state.collector.save(data_file)
-                logger.info(f"Saved {len(app.state.collector)} samples on shutdown to {data_file}")
+                sample_count = await save_collector_snapshot()
+                logger.info(f"Saved {sample_count} samples on shutdown to {app.state.collector_file}")
         except Exception as e:
             logger.error(f"Failed to save data on shutdown: {e}")
 
 
+# Strong references to fire-and-forget tasks so they are not garbage collected
+background_tasks: set[asyncio.Task] = set()
+
+
+# Serializes appends so concurrent saves don't interleave lines in the data file
+collector_file_lock = asyncio.Lock()
+
+
+async def save_collector_snapshot() -> int:
+    """
+    Drain the collector and append the samples to the data file in a worker thread.
+
+    New interactions can be collected while the file is being written.
+    If the save fails, the samples are put back so a later save can retry.
+
+    Returns:
+        Number of samples saved
+    """
+    collector = app.state.collector
+    snapshot = collector.drain()
+    try:
+        async with collector_file_lock:
+            await asyncio.to_thread(snapshot.append, app.state.collector_file)
+    except Exception:
+        collector.single_turn_samples[:0] = snapshot.single_turn_samples
+        collector.multi_turn_samples[:0] = snapshot.multi_turn_samples
+        raise
+    return len(snapshot)
+
+
+async def auto_save_collector() -> None:
+    """Background auto-save of collected data (errors are logged, not raised)"""
+    try:
+        sample_count = await save_collector_snapshot()
+        logger.info(f"Auto-saved {sample_count} samples to {app.state.collector_file}")
+    except Exception as e:
+        logger.error(f"Failed to auto-save collected data: {e}")
+
+
 # Dependency injection functions
 async def get_agent():
     """Dependency that provides the initialized agent"""
@@ -111,12 +187,8 @@ async def save_collected_data() -> dict[str, Any]:
         return {"status": "ok", "message": "No data to save", "samples": 0}
     
     try:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        data_file = PROJECT_ROOT / RAGAS_DATA_DIR / f"agent_data_{timestamp}.json"
-        app.state.collector.save(data_file)
-        
-        sample_count = len(app.state.collector)
-        app.state.collector.clear()
+        data_file = app.state.collector_file
+        sample_count = await save_collector_snapshot()
         
         logger.info(f"Manual save: {sample_count} samples saved to {data_file}")
         
@@ -136,12 +208,19 @@ async def chat(request: ChatRequest, agent=Depends(get_agent)) -> dict[str, Any]
     """
     Simple non-streaming chat endpoint.
     Returns the complete response from the LangChain agent.
+
+    Responses are cached for a short time per conversation history, so
+    repeated questions skip the LLM and retrieval round-trips.
     """
     try:
+        cache_key = hashlib.blake2b(orjson.dumps(request.as_agent_input)).hexdigest()
+        cached_response = app.state.chat_cache.get(cache_key)
+        if cached_response is not None:
+            logger.info("Serving cached chat response")
+            return cached_response
+
         # Run the agent (it will decide whether to use the RAG tool)
-        result = await agent.ainvoke({
-            "messages": [{"role": m.role, "content": m.content} for m in request.messages]
-        })
+        result = await agent.ainvoke({"messages": request.as_agent_input})
 
         # Extract the assistant's response
         assistant_message = result["messages"][-1].content if result.get("messages") else ""
@@ -149,17 +228,23 @@ async def chat(request: ChatRequest, agent=Depends(get_agent)) -> dict[str, Any]
         # Extract tool calls if any (for debugging/visibility)
         tool_calls = []
         for msg in result.get("messages", []):
-            if hasattr(msg, "tool_calls") and msg.tool_calls:
+            if isinstance(msg, AIMessage) and msg.tool_calls:
                 tool_calls.extend([
                     {"name": tc.get("name", ""), "args": tc.get("args", {})}
                     for tc in msg.tool_calls
                 ])
 
-        return {
+        response = {
             "content": assistant_message,
             "toolCalls": tool_calls
         }
 
+        # Only cache answers that did not depend on side-effecting or user-specific tools
+        if all(tc["name"] in CHAT_CACHEABLE_TOOLS for tc in tool_calls):
+            app.state.chat_cache.set(cache_key, response)
+
+        return response
+
     except Exception as e:
         logger.error(f"Chat error: {e}", exc_info=True)
         return {"error": str(e), "content": "Sorry, I encountered an error processing your request."}
@@ -178,80 +263,72 @@ async def chat_stream(request: ChatRequest, agent=Depends(get_agent)) -> Streami
             logger.info(f"Processing query: {last_message}")
 
             # Stream agent response (agent will call RAG tool if needed)
-            full_content = ""
+            content_parts: list[str] = []
+            content_message_id = None
+            conversation_messages = []
             event_count = 0
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-            # Use stream_mode="values" to get complete state updates
-            async for chunk in agent.astream(
-                {"messages": [{"role": m.role, "content": m.content} for m in request.messages]},
-                stream_mode="values"
+            # "messages" yields LLM tokens as they are generated; "values" yields the
+            # state after each step, which carries complete tool calls and the history
+            async for mode, payload in agent.astream(
+                {"messages": request.as_agent_input},
+                stream_mode=["messages", "values"]
             ):
                 event_count += 1
 
-                # Get all messages from the chunk
-                messages = chunk.get("messages", [])
-                if not messages:
-                    logger.debug(f"Event {event_count}: No messages in chunk")
+                if mode == "values":
+                    conversation_messages = payload.get("messages", [])
+                    if not conversation_messages:
+                        logger.debug("Event %d: No messages in state", event_count)
+                        continue
+
+                    # Tool calls are only complete once the model step has finished
+                    last_msg = conversation_messages[-1]
+                    if isinstance(last_msg, AIMessage) and last_msg.tool_calls:
+                        for tool_call in last_msg.tool_calls:
+                            tool_data = {
+                                "id": tool_call.get("id", ""),
+                                "name": tool_call.get("name", ""),
+                                "args": tool_call.get("args", {})
+                            }
+                            logger.info("Event %d: Sending tool_call: %s", event_count, tool_call.get("name"))
+                            yield TOOL_CALL_EVENT % orjson.dumps(tool_data)
+                    continue
+
+                # Skip tool output (only forward AI tokens)
+                message_chunk, _metadata = payload
+                if not isinstance(message_chunk, AIMessage):
                     continue
 
-                # Get the last message (most recent)
-                last_msg = messages[-1]
-                msg_class_name = type(last_msg).__name__
-                msg_type = getattr(last_msg, 'type', 'unknown')  # LangChain uses 'type' not 'role'
-                msg_content = getattr(last_msg, 'content', '')
-                msg_has_tool_calls = hasattr(last_msg, 'tool_calls') and last_msg.tool_calls
+                delta = str(message_chunk.text)
+                if not delta:
+                    continue
 
-                logger.info(f"Event {event_count}: class={msg_class_name}, type={msg_type}, content_len={len(str(msg_content)) if msg_content else 0}, has_tools={msg_has_tool_calls}")
+                if message_chunk.id != content_message_id:
+                    # A new AI message replaces the content shown so far
+                    content_message_id = message_chunk.id
+                    content_parts = [delta]
+                    event_template = CONTENT_EVENT
+                else:
+                    content_parts.append(delta)
+                    event_template = DELTA_EVENT
 
-                # Skip human and system messages (only process AI messages)
-                if msg_type != 'ai':
-                    continue
+                # Per-token logging is skipped entirely unless debug is enabled
+                if debug_enabled:
+                    logger.debug("Event %d: Sending content (length: %d)", event_count, len(delta))
+                yield event_template % orjson.dumps(delta)
 
-                # Check for tool calls
-                if hasattr(last_msg, "tool_calls") and last_msg.tool_calls:
-                    for tool_call in last_msg.tool_calls:
-                        tool_data = {
-                            "type": "tool_call",
-                            "toolCall": {
-                                "id": tool_call.get("id", ""),
-                                "name": tool_call.get("name", ""),
-                                "args": tool_call.get("args", {})
-                            }
-                        }
-                        event_json = json.dumps(tool_data)
-                        logger.info(f"Event {event_count}: Sending tool_call: {tool_call.get('name')}")
-                        yield f"data: {event_json}\n\n"
-
-                # Send content updates
-                if hasattr(last_msg, "content") and last_msg.content:
-                    current_content = str(last_msg.content)
-
-                    # Only send if content changed
-                    if current_content != full_content:
-                        full_content = current_content
-                        content_data = {
-                            "type": "content",
-                            "content": full_content
-                        }
-                        logger.info(f"Event {event_count}: Sending content update (length: {len(full_content)})")
-                        yield f"data: {json.dumps(content_data)}\n\n"
+            full_content = "".join(content_parts)
 
             # Always send final content (even if empty)
-            final_content_data = {
-                "type": "content",
-                "content": full_content if full_content else "I processed your request."
-            }
+            final_content = full_content if full_content else "I processed your request."
             logger.info(f"Sending final content (length: {len(full_content)}, events: {event_count})")
-            yield f"data: {json.dumps(final_content_data)}\n\n"
+            yield CONTENT_EVENT % orjson.dumps(final_content)
 
             # Collect data for evaluation if enabled
             if hasattr(app.state, 'collector') and app.state.collector is not None:
                 try:
-                    # Reconstruct full message history from the agent
-                    conversation_messages = []
-                    for msg in chunk.get("messages", []):
-                        conversation_messages.append(msg)
-                    
                     if conversation_messages:
                         # Add as multi-turn sample
                         app.state.collector.add_multi_turn(
@@ -265,25 +342,20 @@ async def chat_stream(request: ChatRequest, agent=Depends(get_agent)) -> Streami
                         app.state.interaction_count += 1
                         logger.info(f"Collected interaction #{app.state.interaction_count} with {len(conversation_messages)} messages")
                         
-                        # Auto-save if interval reached
+                        # Auto-save if interval reached (in the background, so the
+                        # done event is not held up by file I/O)
                         if app.state.interaction_count % app.state.auto_save_interval == 0:
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                            data_file = PROJECT_ROOT / RAGAS_DATA_DIR / f"agent_data_{timestamp}.json"
-                            app.state.collector.save(data_file)
-                            logger.info(f"Auto-saved {len(app.state.collector)} samples to {data_file}")
-                            
-                            # Clear collector after save to avoid memory buildup
-                            app.state.collector.clear()
-                            logger.info("Cleared collector after auto-save")
+                            task = asyncio.create_task(auto_save_collector())
+                            background_tasks.add(task)
+                            task.add_done_callback(background_tasks.discard)
                     else:
                         logger.warning("No messages to collect for this interaction")
                 except Exception as e:
                     logger.error(f"Failed to collect interaction data: {e}")
 
             # Signal completion
-            done_event = json.dumps({'type': 'done'})
             logger.info(f"Query completed. Total events: {event_count}, Final content length: {len(full_content)}")
-            yield f"data: {done_event}\n\n"
+            yield DONE_EVENT
 
         except Exception as e:
             logger.error(f"Streaming error: {e}", exc_info=True)
@@ -291,7 +363,7 @@ async def chat_stream(request: ChatRequest, agent=Depends(get_agent)) -> Streami
                 "type": "error",
                 "error": str(e)
             }
-            yield f"data: {json.dumps(error_data)}\n\n"
+            yield sse_event(error_data)
 
     return StreamingResponse(
         event_stream(),
@@ -306,6 +378,14 @@ async def chat_stream(request: ChatRequest, agent=Depends(get_agent)) -> Streami
 
 if __name__ == "__main__":
     print("Starting MSI AI Assistant API Server...")
-    print("API: http://localhost:8080")
+    print(f"API: http://localhost:{API_PORT}")
     print("Connect to Angular UI at http://localhost:4200")
-    uvicorn.run(app, host="0.0.0.0", port=8080, log_level="info")
+    # uvicorn[standard] provides uvloop and httptools, which uvicorn picks
+    # automatically; an import string is required to run multiple workers
+    uvicorn.run(
+        "src.api.server:app",
+        host=API_HOST,
+        port=API_PORT,
+        workers=API_WORKERS,
+        log_level="info",
+    )
@@ -8,12 +8,18 @@ requiring separate authentication flows for each server.
 
 import json
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from key_value.aio.stores.disk import DiskStore
 
 
 # Store token in user's home directory
 TOKEN_FILE = Path.home() / ".msi-assistant" / "token.json"
 
+# fastmcp OAuth state (client registration + tokens) for the MCP client
+OAUTH_STORE_DIR = TOKEN_FILE.parent / "oauth"
+
 
 def save_token(token: str) -> None:
     """
@@ -50,4 +56,20 @@ def clear_token() -> None:
     Useful for logging out or forcing re-authentication.
     """
     if TOKEN_FILE.exists():
-        TOKEN_FILE.unlink()
\ No newline at end of file
+        TOKEN_FILE.unlink()
+
+
+def create_oauth_token_storage() -> "DiskStore":
+    """
+    Create persistent storage for the MCP client's OAuth tokens.
+
+    Passed to fastmcp's OAuth so a restart within the token lifetime reuses
+    the stored token instead of opening the browser login flow again.
+
+    Returns:
+        Disk-backed key-value store under OAUTH_STORE_DIR
+    """
+    from key_value.aio.stores.disk import DiskStore
+
+    OAUTH_STORE_DIR.mkdir(parents=True, exist_ok=True)
+    return DiskStore(directory=OAUTH_STORE_DIR)
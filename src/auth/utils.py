@@ -5,57 +5,95 @@ This module provides common functions for role-based access control
 and token claims extraction used across multiple MCP servers.
 """
 
-from typing import List, Optional
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional
 from fastmcp.server.dependencies import get_access_token, AccessToken
 
+# Role set for admin-only operations (built once rather than per check)
+ADMIN_ROLES: frozenset[str] = frozenset({"admin"})
 
-def check_roles(allowed_roles: List[str]) -> bool:
+
+def get_user_claims() -> Optional[Dict[str, Any]]:
+    """
+    Get the token claims of the currently authenticated user.
+
+    Tools that need several claims can look them up once and pass the result
+    to the helpers below instead of resolving the access token per helper.
+
+    Returns:
+        The token's claims dict, or None if no token
+    """
+    token: AccessToken | None = get_access_token()
+    return token.claims if token else None
+
+
+def _resolve_claims(claims: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Use the given claims, or look up the current user's claims"""
+    return claims if claims is not None else get_user_claims()
+
+
+def check_roles(
+    allowed_roles: AbstractSet[str] | Iterable[str],
+    claims: Optional[Dict[str, Any]] = None
+) -> bool:
     """
     Check if the current user has any of the allowed roles.
 
     Args:
-        allowed_roles: List of role names to check against
+        allowed_roles: Role names to check against (pass a set or frozenset,
+            e.g. ADMIN_ROLES, to avoid building one per call)
+        claims: Optional claims from get_user_claims() (looked up if omitted)
 
     Returns:
         True if user has at least one of the allowed roles, False otherwise
     """
-    token: AccessToken | None = get_access_token()
-    if not token:
+    claims = _resolve_claims(claims)
+    if not claims:
         return False
-    roles = token.claims.get("roles")
+    roles = claims.get("roles")
     if not roles:
         return False
-    return any(role in roles for role in allowed_roles)
+    if not isinstance(allowed_roles, AbstractSet):
+        allowed_roles = set(allowed_roles)
+    return not allowed_roles.isdisjoint(roles)
 
 
-def get_username() -> Optional[str]:
+def get_username(claims: Optional[Dict[str, Any]] = None) -> Optional[str]:
     """
     Get the username of the currently authenticated user.
 
+    Args:
+        claims: Optional claims from get_user_claims() (looked up if omitted)
+
     Returns:
         Username from the token's 'sub' claim, or None if no token
     """
-    token: AccessToken | None = get_access_token()
-    return token.claims.get("sub") if token else None
+    claims = _resolve_claims(claims)
+    return claims.get("sub") if claims is not None else None
 
 
-def get_user_roles() -> Optional[List[str]]:
+def get_user_roles(claims: Optional[Dict[str, Any]] = None) -> Optional[List[str]]:
     """
     Get the roles of the currently authenticated user.
 
+    Args:
+        claims: Optional claims from get_user_claims() (looked up if omitted)
+
     Returns:
         List of role names from the token's 'roles' claim, or None if no token
     """
-    token: AccessToken | None = get_access_token()
-    return token.claims.get("roles") if token else None
+    claims = _resolve_claims(claims)
+    return claims.get("roles") if claims is not None else None
 
 
-def get_user_organizations() -> Optional[List[str]]:
+def get_user_organizations(claims: Optional[Dict[str, Any]] = None) -> Optional[List[str]]:
     """
     Get the organizations of the currently authenticated user.
 
+    Args:
+        claims: Optional claims from get_user_claims() (looked up if omitted)
+
     Returns:
         List of organization names from the token's 'organizations' claim, or None if no token
     """
-    token: AccessToken | None = get_access_token()
-    return token.claims.get("organizations") if token else None
\ No newline at end of file
+    claims = _resolve_claims(claims)
+    return claims.get("organizations") if claims is not None else None
\ No newline at end of file
@@ -11,20 +11,20 @@ Usage:
         project_root=PROJECT_ROOT,
         logger=logger
     )
+
+The LangChain agent, OpenAI, Chroma and MCP packages take seconds to import,
+so they are imported inside the factories that need them. Importing this
+module (e.g. from the API server or during test collection) stays cheap.
 """
 
 from pathlib import Path
-from typing import List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple
+import asyncio
 import logging
 
-from langchain_openai import OpenAIEmbeddings
-from langchain.agents import create_agent
-from langchain.agents.middleware import ToolCallLimitMiddleware
-from langchain.chat_models import init_chat_model
+import httpx
 from langchain_core.rate_limiters import InMemoryRateLimiter
 from langchain_core.tools import Tool
-from langchain_mcp_adapters.client import MultiServerMCPClient
-from fastmcp.client.auth import OAuth
 
 from src.core.config import (
     DEFAULT_MODEL,
@@ -36,11 +36,23 @@ from src.core.config import (
     TOOL_CALL_EXIT_BEHAVIOR,
     SYSTEM_PROMPT,
     EMBEDDING_MODEL,
+    EMBEDDING_DIMENSIONS,
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_MAX_CONCURRENCY,
+    EMBEDDING_MAX_RETRIES,
+    EMBEDDING_CHECK_CTX_LENGTH,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_TIMEOUT,
     MCP_TICKETING_URL,
     MCP_ORGANIZATIONS_URL,
     MCP_ISSUER_URL,
 )
-from src.rag.registry import create_default_rag_tools
+from src.auth.token_store import create_oauth_token_storage
+
+if TYPE_CHECKING:
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+    from src.rag.embeddings import ConcurrentOpenAIEmbeddings
 
 
 def create_rate_limiter() -> InMemoryRateLimiter:
@@ -52,21 +64,68 @@ def create_rate_limiter() -> InMemoryRateLimiter:
     )
 
 
-def create_model(rate_limiter: InMemoryRateLimiter) -> Any:
+def create_http_clients() -> Tuple[httpx.Client, httpx.AsyncClient]:
+    """
+    Create pooled HTTP clients shared by the LLM and embeddings.
+
+    Sharing one connection pool keeps connections to the OpenAI API warm
+    across chat and embedding requests, avoiding repeated TLS handshakes.
+
+    Returns:
+        Tuple of (sync client, async client)
+    """
+    limits = httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    )
+    timeout = httpx.Timeout(HTTP_TIMEOUT)
+    return (
+        httpx.Client(limits=limits, timeout=timeout),
+        httpx.AsyncClient(limits=limits, timeout=timeout),
+    )
+
+
+def create_model(
+    rate_limiter: InMemoryRateLimiter,
+    http_client: Optional[httpx.Client] = None,
+    http_async_client: Optional[httpx.AsyncClient] = None
+) -> Any:
     """Create LLM with rate limiting"""
+    from langchain.chat_models import init_chat_model
+
+    # Custom HTTP clients are only understood by the OpenAI integration
+    client_kwargs = {}
+    if DEFAULT_MODEL_PROVIDER == "openai":
+        client_kwargs = {"http_client": http_client, "http_async_client": http_async_client}
+
     return init_chat_model(
         DEFAULT_MODEL,
         model_provider=DEFAULT_MODEL_PROVIDER,
-        rate_limiter=rate_limiter
+        rate_limiter=rate_limiter,
+        **client_kwargs
     )
 
 
-def create_embeddings() -> OpenAIEmbeddings:
-    """Create embeddings model"""
-    return OpenAIEmbeddings(model=EMBEDDING_MODEL)
+def create_embeddings(
+    http_client: Optional[httpx.Client] = None,
+    http_async_client: Optional[httpx.AsyncClient] = None
+) -> "ConcurrentOpenAIEmbeddings":
+    """Create embeddings model (batched requests are sent concurrently)"""
+    from src.rag.embeddings import ConcurrentOpenAIEmbeddings
+
+    return ConcurrentOpenAIEmbeddings(
+        model=EMBEDDING_MODEL,
+        dimensions=EMBEDDING_DIMENSIONS,
+        chunk_size=EMBEDDING_BATCH_SIZE,
+        max_concurrency=EMBEDDING_MAX_CONCURRENCY,
+        max_retries=EMBEDDING_MAX_RETRIES,
+        check_embedding_ctx_length=EMBEDDING_CHECK_CTX_LENGTH,
+        http_client=http_client,
+        http_async_client=http_async_client
+    )
 
 
-async def create_mcp_client() -> MultiServerMCPClient:
+async def create_mcp_client() -> "MultiServerMCPClient":
     """
     Create MCP client with shared OAuth authentication for all servers (SSO).
 
@@ -76,8 +135,12 @@ async def create_mcp_client() -> MultiServerMCPClient:
     Returns:
         MultiServerMCPClient configured with shared authentication
     """
+    from fastmcp.client.auth import OAuth
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+
     # Create shared OAuth - browser opens once, token shared for all servers
-    shared_oauth = OAuth(mcp_url=MCP_ISSUER_URL)
+    # (and persisted, so a restart can skip the browser while it is valid)
+    shared_oauth = OAuth(mcp_url=MCP_ISSUER_URL, token_storage=create_oauth_token_storage())
 
     return MultiServerMCPClient(
         {
@@ -97,7 +160,7 @@ async def create_mcp_client() -> MultiServerMCPClient:
 
 
 async def get_mcp_tools(
-    mcp_client: MultiServerMCPClient,
+    mcp_client: "MultiServerMCPClient",
     logger: logging.Logger
 ) -> List[Tool]:
     """Get tools from MCP client with error handling"""
@@ -110,6 +173,42 @@ async def get_mcp_tools(
         return []
 
 
+async def create_rag_tools(
+    project_root: Path,
+    embeddings: "ConcurrentOpenAIEmbeddings",
+    custom_rag_agents: Optional[List] = None
+) -> List[Tool]:
+    """Create RAG tools (MSI docs plus any custom RAG agent classes)"""
+    from src.rag.registry import RAGAgentRegistry, create_default_rag_tools
+
+    if not custom_rag_agents:
+        # Default: just MSI docs
+        return await create_default_rag_tools(project_root, embeddings)
+
+    # If custom agents provided, use registry
+    from src.rag.agents.msi_docs import MSIDocsRAGAgent
+    registry = RAGAgentRegistry()
+
+    # Always include default MSI docs agent
+    registry.register(MSIDocsRAGAgent(project_root, embeddings))
+
+    # Add custom agents
+    for agent_class in custom_rag_agents:
+        registry.register(agent_class(project_root, embeddings))
+
+    return await registry.get_all_tools()
+
+
+# Process-level cache of initialized (agent, mcp_client) pairs
+_agent_cache: Dict[Tuple[Path, Tuple], Tuple[Any, "MultiServerMCPClient"]] = {}
+_agent_cache_lock = asyncio.Lock()
+
+
+def clear_agent_cache() -> None:
+    """Forget cached agents so the next initialization builds a new one"""
+    _agent_cache.clear()
+
+
 async def initialize_agent_components(
     project_root: Path,
     logger: logging.Logger,
@@ -119,6 +218,9 @@ async def initialize_agent_components(
     Initialize all components needed for the MSI Support Agent.
 
     This is the main entry point used by both api_server.py and main.py.
+    The result is cached per process, so repeated calls with the same
+    arguments reuse the agent instead of repeating OAuth, MCP tool listing
+    and indexing. Concurrent first calls wait for a single initialization.
 
     Args:
         project_root: Path to project root directory
@@ -143,46 +245,59 @@ async def initialize_agent_components(
             custom_rag_agents=[CustomRAGAgent]
         )
     """
+    cache_key = (project_root, tuple(custom_rag_agents or ()))
+    cached = _agent_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    async with _agent_cache_lock:
+        cached = _agent_cache.get(cache_key)
+        if cached is None:
+            cached = await _build_agent_components(project_root, logger, custom_rag_agents)
+            _agent_cache[cache_key] = cached
+        return cached
+
+
+async def _build_agent_components(
+    project_root: Path,
+    logger: logging.Logger,
+    custom_rag_agents: Optional[List] = None
+) -> Tuple[Any, "MultiServerMCPClient"]:
+    """Build the agent and MCP client (uncached, see initialize_agent_components)"""
+    from langchain.agents import create_agent
+    from langchain.agents.middleware import ToolCallLimitMiddleware
+    from src.core.middleware import ToolSchemaCacheMiddleware
+
     logger.info("Initializing MSI Support Agent...")
 
     # Step 1: Create rate limiter
     rate_limiter = create_rate_limiter()
     logger.info(f"Rate limiter configured: {RATE_LIMIT_REQUESTS_PER_SECOND} requests/second")
 
-    # Step 2: Create LLM
-    model = create_model(rate_limiter)
+    # Step 2: Create LLM (shares a pooled HTTP client with the embeddings)
+    http_client, http_async_client = create_http_clients()
+    model = create_model(rate_limiter, http_client, http_async_client)
     logger.info(f"Model configured: {DEFAULT_MODEL} ({DEFAULT_MODEL_PROVIDER})")
 
     # Step 3: Create embeddings
-    embeddings = create_embeddings()
+    embeddings = create_embeddings(http_client, http_async_client)
     logger.info(f"Embeddings configured: {EMBEDDING_MODEL}")
 
-    # Step 4: Create RAG tools
-    if custom_rag_agents:
-        # If custom agents provided, use registry
-        from rag_agents import RAGAgentRegistry, MSIDocsRAGAgent
-        registry = RAGAgentRegistry()
-
-        # Always include default MSI docs agent
-        registry.register(MSIDocsRAGAgent(project_root, embeddings))
-
-        # Add custom agents
-        for agent_class in custom_rag_agents:
-            registry.register(agent_class(project_root, embeddings))
-
-        rag_tools = await registry.get_all_tools()
-    else:
-        # Default: just MSI docs
-        rag_tools = await create_default_rag_tools(project_root, embeddings)
-
-    logger.info(f"Initialized {len(rag_tools)} RAG tool(s)")
+    # Step 4: Start building RAG tools (indexing runs while MCP tools load)
+    rag_task = asyncio.create_task(create_rag_tools(project_root, embeddings, custom_rag_agents))
 
     # Step 5: Create MCP client with shared OAuth (SSO)
     # OAuth flow will trigger automatically on first connection (browser opens once)
     # The same OAuth instance is reused for all servers = Single Sign-On
     logger.info("Creating MCP client with shared OAuth authentication...")
-    mcp_client = await create_mcp_client()
-    mcp_tools = await get_mcp_tools(mcp_client, logger)
+    try:
+        mcp_client = await create_mcp_client()
+        mcp_tools, rag_tools = await asyncio.gather(get_mcp_tools(mcp_client, logger), rag_task)
+    except BaseException:
+        rag_task.cancel()
+        raise
+
+    logger.info(f"Initialized {len(rag_tools)} RAG tool(s)")
 
     # Step 7: Combine all tools
     all_tools = mcp_tools + rag_tools
@@ -195,11 +310,14 @@ async def initialize_agent_components(
     )
     logger.info(f"Tool call limit configured: {TOOL_CALL_LIMIT} calls per query")
 
+    # Tool schemas are converted once here instead of on every model call
+    tool_schema_cache = ToolSchemaCacheMiddleware(all_tools)
+
     # Step 9: Create agent
     agent = create_agent(
         model,
         tools=all_tools,
-        middleware=[tool_call_limit],
+        middleware=[tool_call_limit, tool_schema_cache],
         system_prompt=SYSTEM_PROMPT
     )
 
@@ -0,0 +1,89 @@
+"""
+In-memory caching utilities for MSI AI Assistant.
+
+Provides a small bounded LRU cache with per-entry expiry, used wherever a
+result is worth reusing for a short time without pulling in an external cache.
+
+Usage:
+    from src.core.cache import TTLCache
+
+    cache = TTLCache(maxsize=256, ttl=300)
+    cache.set("key", value)
+    value = cache.get("key")  # None once expired or evicted
+"""
+
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Optional, Tuple, TypeVar
+import time
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[V]):
+    """
+    Bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Expired entries are dropped lazily when read, or in bulk via purge_expired().
+    When full, the least recently used entry is evicted.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """Return the cached value for key, or default if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store value under key, evicting the least recently used entry if full"""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """Remove key and return its value, or default if missing or expired"""
+        value = self.get(key, default)
+        self._entries.pop(key, None)
+        return value
+
+    def purge_expired(self) -> int:
+        """Drop all expired entries. Returns the number of entries removed."""
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        return len(expired)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._entries.clear()
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        """Number of stored entries (may include expired entries not yet purged)"""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"TTLCache(size={len(self)}, maxsize={self.maxsize}, ttl={self.ttl})"
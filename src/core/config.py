@@ -26,6 +26,14 @@ RATE_LIMIT_REQUESTS_PER_SECOND = 2  # 120 requests/minute
 RATE_LIMIT_CHECK_INTERVAL = 0.1     # Check every 100ms
 RATE_LIMIT_MAX_BUCKET_SIZE = 10     # Allow bursts of up to 10 requests
 
+# =============================================================================
+# HTTP Client Configuration
+# =============================================================================
+
+HTTP_MAX_CONNECTIONS = 100          # Pooled connections shared by LLM and embeddings
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20 # Idle connections kept warm between requests
+HTTP_TIMEOUT = 60.0                 # Seconds
+
 # =============================================================================
 # Agent Configuration
 # =============================================================================
@@ -46,6 +54,11 @@ SYSTEM_PROMPT = (
 # =============================================================================
 
 EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIMENSIONS = 512          # Shortened vectors (full size: 1536); None keeps full size
+EMBEDDING_BATCH_SIZE = 100          # Texts per embeddings request (small enough to split indexing across requests)
+EMBEDDING_MAX_CONCURRENCY = 5       # Embeddings requests in flight at once (OpenAI RPM limits)
+EMBEDDING_MAX_RETRIES = 5           # Retries with backoff when concurrent requests hit rate limits
+EMBEDDING_CHECK_CTX_LENGTH = False  # Skip client-side tiktoken tokenization (chunks are far below the 8191-token limit)
 
 # =============================================================================
 # Vector Store Configuration
@@ -53,11 +66,44 @@ EMBEDDING_MODEL = "text-embedding-3-small"
 
 VECTOR_STORE_COLLECTION_NAME = "msi_support_docs"
 CHROMA_PERSIST_DIR = "chroma_langchain_db"
+INDEX_MARKER_FILE = ".ingested"     # Written next to the index once documents are ingested
+
+# HNSW index (fixed when a collection is created; changing it triggers a re-index)
+HNSW_SPACE = "cosine"               # OpenAI embeddings are unit length
+HNSW_MAX_NEIGHBORS = 24             # Graph degree "M" (Chroma default: 16)
+HNSW_EF_CONSTRUCTION = 128          # Build-time candidate list (Chroma default: 100)
+HNSW_EF_SEARCH = 100                # Query-time candidate list
 
 # Text Splitting
-CHUNK_SIZE = 1500                   # ~375 tokens per chunk
-CHUNK_OVERLAP = 300                 # 20% overlap for context continuity
+CHUNK_SIZE = 1600                   # ~400 tokens per chunk (~4 characters per token)
+CHUNK_OVERLAP = 240                 # ~60 tokens (15%) overlap for context continuity
 CHUNK_SEPARATORS = ["\n\n", "\n", ". ", " ", ""]
+MIN_CHUNK_SIZE = 400                # Smaller chunks (~100 tokens) are folded into the previous chunk
+
+# Retrieval
+SEARCH_FETCH_K = 20                 # Candidates fetched before MMR picks the k most diverse
+SEARCH_MMR_LAMBDA = 0.5             # MMR trade-off: 1.0 = pure relevance, 0.0 = pure diversity
+SEARCH_CACHE_SIZE = 512             # Cached results for repeated queries
+QUERY_EMBEDDING_CACHE_SIZE = 1024   # Cached query vectors (skip the embeddings round-trip)
+
+# =============================================================================
+# API Response Cache
+# =============================================================================
+
+CHAT_CACHE_SIZE = 256               # Cached /api/chat responses
+CHAT_CACHE_TTL = 300                # Seconds before a cached response goes stale
+# Responses are only cached if every tool call was read-only (no tickets created, etc.)
+CHAT_CACHEABLE_TOOLS = frozenset({"search_msi_documentation"})
+
+# =============================================================================
+# API Server Configuration
+# =============================================================================
+
+API_HOST = "0.0.0.0"
+API_PORT = 8080
+# Each worker holds its own agent, rate limiter, caches and Ragas collector,
+# so raising this also multiplies the effective LLM request rate
+API_WORKERS = 1
 
 # =============================================================================
 # MCP Server Configuration
@@ -66,6 +112,13 @@ CHUNK_SEPARATORS = ["\n\n", "\n", ". ", " ", ""]
 MCP_TICKETING_URL = "http://127.0.0.1:9000/mcp"
 MCP_ORGANIZATIONS_URL = "http://127.0.0.1:9001/mcp"
 MCP_ISSUER_URL = "http://127.0.0.1:9400"  # OAuth IDP for authentication
+# JWT signing algorithm used by the mock IDP and verified by the MCP servers.
+# ES256 signs ~18x faster than RS256; set "RS256" for RSA-only consumers.
+MCP_JWT_ALGORITHM = "ES256"
+MCP_TOKEN_CACHE_SIZE = 10000        # Verified bearer tokens remembered by each MCP server
+MCP_TOKEN_CACHE_TTL = 5             # Seconds before a cached token is verified again
+MCP_PERMISSIONS_CACHE_SIZE = 2048   # Cached (username, organization) permission lookups
+MCP_PERMISSIONS_CACHE_TTL = 30      # Seconds before a caller's permissions are re-read
 
 # =============================================================================
 # Logging Configuration
@@ -79,3 +132,4 @@ LOG_KEEP_RECENT = 10  # Keep last 10 log files
 
 ENABLE_RAGAS_COLLECTION = True  # Enable Ragas data collection
 RAGAS_DATA_DIR = "logs/ragas_data"  # Directory to save collected data for evaluation
+RAGAS_EVAL_MAX_WORKERS = 16  # Metric LLM calls in flight at once during evaluation
@@ -0,0 +1,60 @@
+"""
+Agent middleware for MSI AI Assistant.
+
+The agent binds its tools to the model on every model call, and binding
+converts each tool to a JSON schema from scratch (~1ms per tool). The tool
+list is fixed when the agent is built, so the schemas are converted once here
+and reused for every call.
+
+Usage:
+    from src.core.middleware import ToolSchemaCacheMiddleware
+
+    agent = create_agent(
+        model,
+        tools=all_tools,
+        middleware=[ToolSchemaCacheMiddleware(all_tools)]
+    )
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List
+
+from langchain.agents.middleware import AgentMiddleware, ModelRequest, ModelResponse
+from langchain_core.tools import BaseTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+
+class ToolSchemaCacheMiddleware(AgentMiddleware):
+    """
+    Replace the agent's tools with precomputed tool schemas on each model call.
+
+    Tool execution is unaffected: the agent routes tool calls by name to the
+    original tools. Tools without a cached schema are passed through unchanged.
+    """
+
+    def __init__(self, tools: List[BaseTool]):
+        super().__init__()
+        self.schemas: Dict[str, Dict[str, Any]] = {
+            tool.name: convert_to_openai_tool(tool) for tool in tools
+        }
+
+    def _with_cached_schemas(self, request: ModelRequest) -> ModelRequest:
+        """Swap each known tool for its cached schema"""
+        tools = [
+            self.schemas.get(tool.name, tool) if isinstance(tool, BaseTool) else tool
+            for tool in request.tools
+        ]
+        return request.override(tools=tools)
+
+    def wrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], ModelResponse],
+    ) -> ModelResponse:
+        return handler(self._with_cached_schemas(request))
+
+    async def awrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], Awaitable[ModelResponse]],
+    ) -> ModelResponse:
+        return await handler(self._with_cached_schemas(request))
@@ -7,8 +7,10 @@ uv run src/main.py
 
 
 import asyncio
+from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
+from langchain_core.messages import AIMessage
 
 # Local imports
 from src.core.utils import setup_logging
@@ -47,6 +49,7 @@ async def main() -> None:
 
     # Initialize Ragas data collection if enabled
     collector = None
+    saved_count = 0
     if ENABLE_RAGAS_COLLECTION:
         collector = RagasDataCollector()
         logger.info(f"Collector created: {collector}")
@@ -55,7 +58,11 @@ async def main() -> None:
         data_dir = PROJECT_ROOT / RAGAS_DATA_DIR
         data_dir.mkdir(parents=True, exist_ok=True)
         
-        logger.info(f"Ragas data collection enabled. Data will be saved to {data_dir}")
+        # Samples are appended one line per query, so a crash keeps earlier results
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        data_file = data_dir / f"agent_data_{timestamp}.jsonl"
+        
+        logger.info(f"Ragas data collection enabled. Data will be saved to {data_file}")
     
     logger.info(f"Collector after init: {collector}")
 
@@ -74,23 +81,36 @@ async def main() -> None:
         try:
             # Collect messages for this conversation
             messages = []
+            displayed = 0
             retrieved_contexts = []
-            final_response = ""
             
-            async for step in agent.astream(
+            # "messages" yields LLM tokens as they are generated; "values" yields
+            # the state after each step
+            async for mode, payload in agent.astream(
                 {"messages": [{"role": "user", "content": query}]},
-                stream_mode="values"
+                stream_mode=["messages", "values"]
             ):
-                # Display message
-                step["messages"][-1].pretty_print()
-                
-                # Collect all messages for multi-turn evaluation
-                messages = step["messages"]
-                
-                # Extract final response
-                last_msg = step["messages"][-1]
-                if hasattr(last_msg, "content"):
-                    final_response = last_msg.content
+                if mode == "messages":
+                    # Print AI tokens as they arrive
+                    message_chunk, _metadata = payload
+                    if isinstance(message_chunk, AIMessage) and message_chunk.text:
+                        print(message_chunk.text, end="", flush=True)
+                    continue
+
+                # Collect all messages for multi-turn evaluation (the state's
+                # list is kept by reference, not copied)
+                messages = payload["messages"]
+
+                # Display only the messages added by this step (AI text has
+                # already been streamed); a step can add several tool results
+                for msg in messages[displayed:]:
+                    if isinstance(msg, AIMessage):
+                        print()
+                        for tool_call in msg.tool_calls:
+                            print(f"Tool call: {tool_call['name']}({tool_call['args']})")
+                    else:
+                        msg.pretty_print()
+                displayed = len(messages)
                 
                 # TODO: Extract retrieved contexts from RAG tool calls
                 # This requires inspecting ToolMessage content from search_msi_documentation
@@ -110,33 +130,24 @@ async def main() -> None:
                             }
                         )
                         logger.info(f"Added multi-turn sample with {len(messages)} messages")
+                        # Write off the event loop, as the API server does for its snapshots
+                        saved_count += await asyncio.to_thread(collector.drain().append, data_file)
                     else:
                         logger.warning("No messages collected for this query")
                 except Exception as e:
-                    logger.error(f"Failed to add sample to collector: {e}")
+                    logger.error(f"Failed to collect sample: {e}")
                     logger.exception("Full traceback:")
                 
         except Exception:
             logger.exception("Query failed")
             raise
     
-    # Save collected data after all queries complete
-    logger.info("All queries completed, saving data...")
+    logger.info("All queries completed")
     if collector is not None:
-        try:
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            data_file = PROJECT_ROOT / RAGAS_DATA_DIR / f"agent_data_{timestamp}.json"
-            
-            logger.info(f"Saving {len(collector)} samples to {data_file}")
-            collector.save(data_file)
-            
-            logger.info(f"Collected {len(collector)} samples")
-            logger.info(f"Data saved to {data_file}")
-            logger.info(f"\nTo evaluate performance, run:")
-            logger.info(f"  uv run python -m src.observability.evaluator {data_file} --type multi_turn")
-        except Exception:
-            logger.exception("Failed to save collected data")
+        logger.info(f"Collected {saved_count} samples")
+        logger.info(f"Data saved to {data_file}")
+        logger.info(f"\nTo evaluate performance, run:")
+        logger.info(f"  uv run python -m src.observability.evaluator {data_file} --type multi_turn")
     else:
         logger.warning("Collector was None, no data to save")
 
@@ -0,0 +1,57 @@
+"""
+Token verification for the MCP servers.
+
+Every MCP tool call carries the caller's bearer token, and JWTVerifier checks
+its signature from scratch each time. A client reuses the same token across a
+burst of tool calls, so CachedJWTVerifier remembers recently verified tokens
+for a few seconds and skips the signature check on repeats.
+
+Usage:
+    from src.mcp.auth import CachedJWTVerifier
+
+    VERIFIER = CachedJWTVerifier(
+        jwks_uri = f"{ISSUER_URL}/jwks",
+        issuer = ISSUER_URL,
+        audience = SERVER_URL,
+        algorithm = MCP_JWT_ALGORITHM
+    )
+"""
+
+import hashlib
+import time
+
+from fastmcp.server.auth.providers.jwt import JWTVerifier
+from mcp.server.auth.provider import AccessToken
+
+from src.core.cache import TTLCache
+from src.core.config import MCP_TOKEN_CACHE_SIZE, MCP_TOKEN_CACHE_TTL
+
+
+class CachedJWTVerifier(JWTVerifier):
+    """
+    JWTVerifier that reuses the result of verifying the same token.
+
+    Only valid tokens are cached, keyed by a SHA-256 of the token so raw
+    tokens aren't held in memory. A cached token is still rejected once its
+    own `exp` has passed, even if the cache entry hasn't expired yet.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._verified: TTLCache[AccessToken] = TTLCache(
+            maxsize=MCP_TOKEN_CACHE_SIZE, ttl=MCP_TOKEN_CACHE_TTL
+        )
+
+    async def verify_token(self, token: str) -> AccessToken | None:
+        key = hashlib.sha256(token.encode()).digest()
+
+        access_token = self._verified.get(key)
+        if access_token is not None:
+            if access_token.expires_at is None or access_token.expires_at > time.time():
+                return access_token
+            self._verified.pop(key)
+
+        access_token = await super().verify_token(token)
+        if access_token is not None:
+            self._verified.set(key, access_token)
+        return access_token
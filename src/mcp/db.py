@@ -0,0 +1,101 @@
+"""
+SQLite connection pooling for the MCP servers.
+
+Opening a connection and applying pragmas on every tool call adds file
+open/close work to each request. A ConnectionPool keeps idle connections
+per database and hands them out for the duration of a `with` block.
+
+The MCP tools are async, so they use the awaitable helpers, which run the
+query on a worker thread instead of blocking the event loop.
+
+Usage:
+    from src.mcp.db import ConnectionPool
+
+    USERS_DB = ConnectionPool(DB_USERS)
+
+    rows = await USERS_DB.fetchall("SELECT username FROM users")
+
+    with USERS_DB.connection() as connection:  # synchronous code
+        connection.execute("ANALYZE users")
+"""
+
+import asyncio
+from contextlib import contextmanager
+import pathlib
+import queue
+import sqlite3
+from typing import Any, Callable, Iterator, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Applied once to each new connection
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",     # Readers don't block the writer
+    "PRAGMA synchronous=NORMAL",   # Safe with WAL; skips an fsync per commit
+    "PRAGMA mmap_size=268435456",  # Read pages through a 256 MB memory map
+    "PRAGMA cache_size=-65536",    # Up to 64 MB page cache per connection
+    "PRAGMA temp_store=MEMORY",    # Sorts and temp tables stay in memory
+)
+
+
+class ConnectionPool:
+    """
+    Pool of reusable connections to one SQLite database.
+
+    Connections are created on demand and returned to the pool when the
+    `with` block exits. Uncommitted changes are rolled back before a
+    connection is reused, so callers still commit explicitly.
+    """
+
+    def __init__(self, db_path: pathlib.Path | str):
+        self.db_path = db_path
+        self._idle: "queue.SimpleQueue[sqlite3.Connection]" = queue.SimpleQueue()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection with the pool's pragmas applied"""
+        # Tools may run on worker threads; each connection is used by one caller at a time
+        connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        for pragma in PRAGMAS:
+            connection.execute(pragma)
+        return connection
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for the duration of a `with` block"""
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            connection = self._connect()
+
+        try:
+            yield connection
+        finally:
+            if connection.in_transaction:
+                connection.rollback()
+            self._idle.put(connection)
+
+    async def run(self, work: Callable[[sqlite3.Connection], T]) -> T:
+        """Call work(connection) on a worker thread with a borrowed connection"""
+        def borrow_and_run() -> T:
+            with self.connection() as connection:
+                return work(connection)
+
+        return await asyncio.to_thread(borrow_and_run)
+
+    async def fetchone(self, query: str, params: Sequence[Any] = ()) -> Optional[Any]:
+        """Run a query on a worker thread and return its first row"""
+        return await self.run(lambda connection: connection.execute(query, params).fetchone())
+
+    async def fetchall(
+        self,
+        query: str,
+        params: Sequence[Any] = (),
+        row_factory: Optional[Callable] = None,
+    ) -> List[Any]:
+        """Run a query on a worker thread and return all rows (tuples unless row_factory is given)"""
+        def fetch(connection: sqlite3.Connection) -> List[Any]:
+            cursor = connection.cursor()
+            cursor.row_factory = row_factory
+            return cursor.execute(query, params).fetchall()
+
+        return await self.run(fetch)
@@ -7,14 +7,17 @@ uv run python -m src.mcp.organizations.server
 
 import pathlib
 import sqlite3
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from fastmcp import FastMCP
 from fastmcp.server.auth import RemoteAuthProvider
-from fastmcp.server.auth.providers.jwt import JWTVerifier
 from pydantic import AnyHttpUrl
 
-from src.auth.utils import check_roles, get_username
+from src.auth.utils import ADMIN_ROLES, check_roles, get_user_claims, get_username
+from src.core.cache import TTLCache
+from src.core.config import MCP_JWT_ALGORITHM, MCP_PERMISSIONS_CACHE_SIZE, MCP_PERMISSIONS_CACHE_TTL
+from src.mcp.auth import CachedJWTVerifier
+from src.mcp.db import ConnectionPool
 
 SERVER_URL = "http://127.0.0.1:9001"
 ISSUER_URL = "http://127.0.0.1:9400"
@@ -22,11 +25,45 @@ PROJECT_ROOT = pathlib.Path(__file__).resolve().parent.parent.parent.parent
 DB_USERS = PROJECT_ROOT / "data" / "databases" / "users.db"
 DB_ORGANIZATIONS = PROJECT_ROOT / "data" / "databases" / "organizations.db"
 
-# JWT Token Verifier
-VERIFIER = JWTVerifier(
+# Connections are reused across tool calls
+USERS_DB = ConnectionPool(DB_USERS)
+ORGANIZATIONS_DB = ConnectionPool(DB_ORGANIZATIONS)
+
+# Callers' permissions per (username, organization); empty if not a member.
+# Permission changes take effect once the entry expires.
+PERMISSIONS_CACHE: TTLCache[FrozenSet[str]] = TTLCache(
+    maxsize = MCP_PERMISSIONS_CACHE_SIZE,
+    ttl = MCP_PERMISSIONS_CACHE_TTL
+)
+
+def _cache_permissions(username: str, organization: str, permissions_str: Optional[str]) -> FrozenSet[str]:
+    """Parse a user's permission string and cache it for the organization"""
+    permissions = frozenset(permissions_str.split(',')) if permissions_str else frozenset()
+    PERMISSIONS_CACHE.set((username, organization), permissions)
+    return permissions
+
+def _bootstrap_indexes() -> None:
+    """
+    Create the users index if missing and refresh planner statistics.
+
+    Usernames already have a UNIQUE index. The organization index also carries
+    username and permissions, so listing an organization's users never reads
+    the table itself.
+    """
+    with USERS_DB.connection() as connection:
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_users_org_covering "
+            "ON users(organization, username, organization_permissions)"
+        )
+        connection.execute("ANALYZE users")
+        connection.commit()
+
+# JWT Token Verifier (repeat tokens skip the signature check for a few seconds)
+VERIFIER = CachedJWTVerifier(
     jwks_uri = f"{ISSUER_URL}/jwks",
     issuer = ISSUER_URL,
-    audience = SERVER_URL
+    audience = SERVER_URL,
+    algorithm = MCP_JWT_ALGORITHM
 )
 
 # Create RemoteAuthProvider for authentication
@@ -61,28 +98,20 @@ async def get_organization_users(
         return {"error": "Error, no argument given for organization"}
     
     try:
-        connection = sqlite3.connect(DB_USERS)
-        cursor = connection.cursor()
-
         # Check permission to use tool
-        if not check_roles(["admin"]):
-            username = get_username()
-            query = "SELECT organization_permissions FROM users WHERE username = ? AND organization = ?"
-            cursor.execute(query, (username, organization,))
-            permissions_str = cursor.fetchone()
-            if permissions_str:
-                permissions = set(permissions_str[0].split(','))
-                if "view_agency_users" not in permissions:
-                        connection.close()
-                        return {"error": "User does not have permission to use this tool for the given organization"}
-            else:
-                connection.close()
+        claims = get_user_claims()
+        if not check_roles(ADMIN_ROLES, claims):
+            username = get_username(claims)
+            permissions = PERMISSIONS_CACHE.get((username, organization))
+            if permissions is None:
+                query = "SELECT organization_permissions FROM users WHERE username = ? AND organization = ?"
+                row = await USERS_DB.fetchone(query, (username, organization,))
+                permissions = _cache_permissions(username, organization, row[0] if row else None)
+            if "view_agency_users" not in permissions:
                 return {"error": "User does not have permission to use this tool for the given organization"}
 
         query = "SELECT username FROM users WHERE organization = ?"
-        cursor.execute(query, (organization,))
-        users = cursor.fetchall()
-        connection.close()
+        users = await USERS_DB.fetchall(query, (organization,))
 
         return {"users": [user[0] for user in users]}
 
@@ -111,53 +140,47 @@ async def compare_user_permissions(
         return {"error": "Error, no argument given for usernames"}
 
     try: 
-        connection = sqlite3.connect(DB_USERS)
-        cursor = connection.cursor()
-
-        # Check permission to use tool
-        if not check_roles(["admin"]):
-            username = get_username()
-            query = "SELECT organization_permissions FROM users where username = ? AND organization = ?"
-            cursor.execute(query, (username, organization,))
-            permissions_str = cursor.fetchone()
-            if permissions_str:
-                permissions = set(permissions_str[0].split(','))
-                if "view_agency_users" not in permissions:
-                        connection.close()
-                        return {"error": "User does not have permission to use this tool for the given organization"}
-            else:
-                connection.close()
-                return {"error": "User does not have permission to use this tool for the given organization"}
+        claims = get_user_claims()
+        is_admin = check_roles(ADMIN_ROLES, claims)
+        caller = None if is_admin else get_username(claims)
+        caller_permissions = None if is_admin else PERMISSIONS_CACHE.get((caller, organization))
+
+        # Fetch every requested user in a single query (plus the caller, unless cached)
+        check_caller = not is_admin and caller_permissions is None
+        lookup_usernames = list(dict.fromkeys([*usernames, caller] if check_caller else usernames))
+        placeholders = ",".join("?" * len(lookup_usernames))
+        query = f"SELECT username, organization, organization_permissions FROM users WHERE username IN ({placeholders})"
+        rows = {
+            username: (org, permissions_str)
+            for username, org, permissions_str in await USERS_DB.fetchall(query, lookup_usernames)
+        }
+
+        # Check permission to use tool (caller must be in the organization with view_agency_users)
+        if check_caller:
+            caller_row = rows.get(caller)
+            in_organization = caller_row is not None and caller_row[0] == organization
+            caller_permissions = _cache_permissions(caller, organization, caller_row[1] if in_organization else None)
+        if not is_admin and "view_agency_users" not in caller_permissions:
+            return {"error": "User does not have permission to use this tool for the given organization"}
 
         # Retrieve user permissions
         user_permissions_map = {}
         all_permissions = []
 
         for user in usernames:
-            query = "SELECT organization_permissions FROM users WHERE username = ?"
-            cursor.execute(query, (user,))
-            permissions_str = cursor.fetchone()
-            if permissions_str:
-                permissions = set(permissions_str[0].split(','))
+            if user in rows:
+                permissions = set(rows[user][1].split(','))
                 user_permissions_map[user] = permissions
                 all_permissions.append(permissions)
             else:
                 user_permissions_map[user] = set()
                 all_permissions.append(set())
 
-        connection.close()
-
         # Compare user permissions
         permissions_comparison = {}
 
-        shared_permissions = []
-        if not all_permissions:
-            shared_permissions = set()
-        else:
-            shared_permissions = all_permissions[0].copy()
-            for permission_set in all_permissions:
-                shared_permissions.intersection_update(permission_set)
-        
+        shared_permissions = set.intersection(*all_permissions) if all_permissions else set()
+
         permissions_comparison["shared_permissions"] = list(shared_permissions)
 
         for user, permissions in user_permissions_map.items():
@@ -180,28 +203,18 @@ async def get_organizations() -> Dict[str, Any]:
     Returns: Dict[str, Any] containing users or an error message.
     """
 
-    if not check_roles(["admin"]):
+    if not check_roles(ADMIN_ROLES):
         return {"error": "User does not have permission to use this tool"}
 
     response_json = {}
     try:
-        connection = sqlite3.connect(DB_ORGANIZATIONS)
-        connection.row_factory = sqlite3.Row
-        cursor = connection.cursor()
-
-        cursor.execute("SELECT name, aware_service, status, region FROM organizations")
-
-        organizations = cursor.fetchall()
-        connection.close()
+        organizations = await ORGANIZATIONS_DB.fetchall(
+            "SELECT name, aware_service, status, region FROM organizations",
+            row_factory = sqlite3.Row
+        )
 
-        for org in organizations:
-            key = org['name']
-            response_json[key] = {
-                "name": org['name'],
-                "aware_service": org['aware_service'],
-                "status": org['status'],
-                "region": org['region']
-            }
+        # Rows already carry the response fields in order, keyed by organization name
+        response_json = {org["name"]: dict(org) for org in organizations}
 
     except Exception as e:
         return {"error": f"Error with request: {str(e)}"}
@@ -210,4 +223,5 @@ async def get_organizations() -> Dict[str, Any]:
 
 
 if __name__ == "__main__":
+    _bootstrap_indexes()
     mcp.run(transport="http", host="127.0.0.1", port=9001)
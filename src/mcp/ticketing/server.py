@@ -11,21 +11,27 @@ from typing import Any, Dict, Optional
 
 from fastmcp import FastMCP
 from fastmcp.server.auth import RemoteAuthProvider
-from fastmcp.server.auth.providers.jwt import JWTVerifier
 from pydantic import AnyHttpUrl
 
-from src.auth.utils import check_roles, get_username, get_user_roles, get_user_organizations
+from src.auth.utils import ADMIN_ROLES, check_roles, get_user_claims, get_username, get_user_roles, get_user_organizations
+from src.core.config import MCP_JWT_ALGORITHM
+from src.mcp.auth import CachedJWTVerifier
+from src.mcp.db import ConnectionPool
 
 SERVER_URL = "http://127.0.0.1:9000"
 ISSUER_URL = "http://127.0.0.1:9400"
 PROJECT_ROOT = pathlib.Path(__file__).resolve().parent.parent.parent.parent
 DB_TICKET = PROJECT_ROOT / "data" / "databases" / "ticket.db"
 
-# JWT Token Verifier
-VERIFIER = JWTVerifier(
+# Connections are reused across tool calls
+TICKET_DB = ConnectionPool(DB_TICKET)
+
+# JWT Token Verifier (repeat tokens skip the signature check for a few seconds)
+VERIFIER = CachedJWTVerifier(
     jwks_uri = f"{ISSUER_URL}/jwks",
     issuer = ISSUER_URL,
-    audience = SERVER_URL
+    audience = SERVER_URL,
+    algorithm = MCP_JWT_ALGORITHM
 )
 
 # Create RemoteAuthProvider for authentication
@@ -101,13 +107,13 @@ async def create_ticket(
 
     # Insert ticket into database
     try:
-        connection = sqlite3.connect(DB_TICKET)
-        cursor = connection.cursor()
-        query = "INSERT INTO tickets (title, description, username, status, response, response_user) VALUES (?, ?, ?, ?, ?, ?)"
-        cursor.execute(query, (title, description, username, "active", None, None))
-        connection.commit()
-        id = cursor.lastrowid
-        connection.close()
+        def insert_ticket(connection: sqlite3.Connection) -> int:
+            query = "INSERT INTO tickets (title, description, username, status, response, response_user) VALUES (?, ?, ?, ?, ?, ?)"
+            cursor = connection.execute(query, (title, description, username, "active", None, None))
+            connection.commit()
+            return cursor.lastrowid
+
+        id = await TICKET_DB.run(insert_ticket)
 
         return f"Ticket successfully created with id: {id}"
     except Exception as e:
@@ -126,7 +132,8 @@ async def resolve_ticket(
     Returns: A string conveying the success of the ticket resolution.
     """
 
-    if not check_roles(["admin"]):
+    claims = get_user_claims()
+    if not check_roles(ADMIN_ROLES, claims):
         return "User does not have permission to use this tool"
 
     if not ticket_id:
@@ -135,37 +142,36 @@ async def resolve_ticket(
         return "Error, no argument given for description"
 
     # Pull user name from token
-    username = get_username()
+    username = get_username(claims)
 
     # Edit ticket to resolved
     try:
-        connection = sqlite3.connect(DB_TICKET)
-        cursor = connection.cursor()
-        
-        cursor.execute("SELECT status FROM tickets where id = ?", (ticket_id,))
-        ticket_data = cursor.fetchone()
-        
-        if ticket_data is None:
-            connection.close()
-            return f"Ticket ID {ticket_id} not found"
-        
-        status = ticket_data[0]
-        if status != "active":
-            connection.close()
-            return f"Ticket {ticket_id} status not active"
-        
-        update = """
-            UPDATE tickets
-            SET status = ?, response = ?, response_user = ?
-            WHERE id = ?
-        """
-        cursor.execute(update, ("resolved", resolution_description, username, ticket_id))
-        
-        connection.commit()
-        id = cursor.lastrowid
-        connection.close()
+        def resolve(connection: sqlite3.Connection) -> str:
+            cursor = connection.cursor()
+
+            cursor.execute("SELECT status FROM tickets where id = ?", (ticket_id,))
+            ticket_data = cursor.fetchone()
+
+            if ticket_data is None:
+                return f"Ticket ID {ticket_id} not found"
+
+            status = ticket_data[0]
+            if status != "active":
+                return f"Ticket {ticket_id} status not active"
 
-        return f"Ticket {id} resolved"
+            update = """
+                UPDATE tickets
+                SET status = ?, response = ?, response_user = ?
+                WHERE id = ?
+            """
+            cursor.execute(update, ("resolved", resolution_description, username, ticket_id))
+
+            connection.commit()
+            id = cursor.lastrowid
+
+            return f"Ticket {id} resolved"
+
+        return await TICKET_DB.run(resolve)
     except Exception as e:
         return f"Error with request: {str(e)}"
 
@@ -183,10 +189,11 @@ async def get_tickets_by_user(
     """
 
     # Only admin or the user owning the ticket should be able to view tickets for some user
-    this_username = get_username()
+    claims = get_user_claims()
+    this_username = get_username(claims)
     goal_username = username if username else this_username
     if this_username != goal_username:
-        if not check_roles(["admin"]):
+        if not check_roles(ADMIN_ROLES, claims):
             return {"error": "User does not have permission to use this tool for the given username"}
 
     if not username:
@@ -194,19 +201,12 @@ async def get_tickets_by_user(
     
     tickets_json = {}
     try:
-        connection = sqlite3.connect(DB_TICKET)
-        connection.row_factory = sqlite3.Row
-        cursor = connection.cursor()
-
         query = """
             SELECT id, title, description, status, response, response_user 
             FROM tickets
             where username = ?
         """
-        cursor.execute(query, (goal_username,))
-
-        ticket_data = cursor.fetchall()
-        connection.close()
+        ticket_data = await TICKET_DB.fetchall(query, (goal_username,), row_factory = sqlite3.Row)
 
         for ticket in ticket_data:
             ticket_id = str(ticket['id']) 
@@ -237,27 +237,21 @@ async def get_tickets_by_status(
     an error message if call was not succesful.
     """
 
-    if not check_roles(["admin"]):
+    if not check_roles(ADMIN_ROLES):
         return "User does not have permission to use this tool"
     
     tickets_json = {}
     try:
-        connection = sqlite3.connect(DB_TICKET)
-        connection.row_factory = sqlite3.Row
-        cursor = connection.cursor()
-
         query = """
             SELECT id, title, description, status, response, response_user
             FROM tickets
         """
+        params = ()
         if status:
             query += " where status = ?"
-            cursor.execute(query, (status,))
-        else:
-            cursor.execute(query)
+            params = (status,)
 
-        ticket_data = cursor.fetchall()
-        connection.close()
+        ticket_data = await TICKET_DB.fetchall(query, params, row_factory = sqlite3.Row)
 
         for ticket in ticket_data:
             ticket_id = str(ticket['id']) 
@@ -2,6 +2,8 @@
 Chat-related Pydantic models for API requests/responses.
 """
 
+from functools import cached_property
+
 from pydantic import BaseModel
 
 
@@ -13,4 +15,9 @@ class ChatMessage(BaseModel):
 
 class ChatRequest(BaseModel):
     """Request body for chat endpoints."""
-    messages: list[ChatMessage]
\ No newline at end of file
+    messages: list[ChatMessage]
+
+    @cached_property
+    def as_agent_input(self) -> list[dict[str, str]]:
+        """Messages in the role/content format the agent expects (built once per request)."""
+        return [{"role": m.role, "content": m.content} for m in self.messages]
@@ -5,12 +5,16 @@ Collects user queries, retrieved contexts, agent responses, and tool calls
 during agent execution for later evaluation with Ragas metrics.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Iterator, Optional
 from pathlib import Path
-import json
 import logging
 from datetime import datetime
 
+import orjson
+
+from langchain_core.messages import HumanMessage as LCHumanMessage
+from langchain_core.messages import AIMessage as LCAIMessage
+from langchain_core.messages import ToolMessage as LCToolMessage
 from ragas.dataset_schema import SingleTurnSample, MultiTurnSample, EvaluationDataset
 from ragas.messages import HumanMessage, AIMessage, ToolMessage, ToolCall
 
@@ -20,6 +24,110 @@ SCHEMA_VERSION = "1.0.0"
 logger = logging.getLogger(__name__)
 
 
+def _convert_human(msg: LCHumanMessage) -> HumanMessage:
+    return HumanMessage(content=msg.content)
+
+
+def _convert_ai(msg: LCAIMessage) -> AIMessage:
+    # Extract tool calls if present
+    tool_calls = [
+        ToolCall(name=tc.get('name', ''), args=tc.get('args', {}))
+        for tc in msg.tool_calls
+    ]
+    return AIMessage(
+        content=msg.content or "",
+        tool_calls=tool_calls if tool_calls else None
+    )
+
+
+def _convert_tool(msg: LCToolMessage) -> ToolMessage:
+    return ToolMessage(content=msg.content)
+
+
+def _convert_other(msg: Any) -> Optional[HumanMessage]:
+    # Fallback: try to extract content
+    if hasattr(msg, 'content'):
+        return HumanMessage(content=str(msg.content))
+    return None
+
+
+# LangChain message class -> converter; subclasses (e.g. AIMessageChunk) are
+# resolved through their MRO on first sight and remembered
+_LC_TO_RAGAS: Dict[type, Callable[[Any], Any]] = {
+    LCHumanMessage: _convert_human,
+    LCAIMessage: _convert_ai,
+    LCToolMessage: _convert_tool,
+}
+
+
+def _converter_for(msg_type: type) -> Callable[[Any], Any]:
+    """Look up the converter for a message class"""
+    converter = _LC_TO_RAGAS.get(msg_type)
+    if converter is None:
+        converter = next(
+            (_LC_TO_RAGAS[base] for base in msg_type.__mro__ if base in _LC_TO_RAGAS),
+            _convert_other
+        )
+        _LC_TO_RAGAS[msg_type] = converter
+    return converter
+
+
+# Ragas message class -> serialized "type" tag (attribute lookups on the
+# pydantic messages cost more than a dict hit)
+_RAGAS_MESSAGE_TYPES: Dict[type, str] = {
+    HumanMessage: "HumanMessage",
+    AIMessage: "AIMessage",
+    ToolMessage: "ToolMessage",
+}
+
+
+def _serialize_message(msg: Any) -> Dict[str, Any]:
+    """Convert a Ragas message to a dict (only AIMessage carries tool calls)"""
+    if isinstance(msg, dict):
+        # Already serialized (samples read back by load())
+        return msg
+    msg_type = type(msg)
+    tool_calls = getattr(msg, "tool_calls", None)
+    return {
+        "type": _RAGAS_MESSAGE_TYPES.get(msg_type) or msg_type.__name__,
+        "content": msg.content,
+        "tool_calls": [
+            {"name": tc.name, "args": tc.args}
+            for tc in tool_calls
+        ] if tool_calls else None,
+    }
+
+
+def _deserialize_message(msg_dict: Dict[str, Any]) -> Optional[Any]:
+    """Rebuild a Ragas message from its serialized dict (None for unknown types)"""
+    msg_type = msg_dict.get("type", "").lower()
+    content = msg_dict.get("content", "")
+
+    if msg_type in ("humanmessage", "human"):
+        return HumanMessage(content=content)
+    if msg_type in ("aimessage", "ai"):
+        tool_calls = [
+            ToolCall(name=tc["name"], args=tc["args"])
+            for tc in msg_dict.get("tool_calls") or ()
+        ]
+        return AIMessage(
+            content=content or "",
+            tool_calls=tool_calls if tool_calls else None
+        )
+    if msg_type in ("toolmessage", "tool"):
+        return ToolMessage(content=content)
+    return None
+
+
+def _serialize_sample(sample: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert Ragas messages to dict for JSON serialization"""
+    serialized = sample.copy()
+    if "messages" in serialized:
+        # Convert Ragas message objects to dicts
+        serialized["messages"] = [_serialize_message(msg) for msg in serialized["messages"]]
+    return serialized
+
+
 class RagasDataCollector:
     """
     Collects execution data for Ragas evaluation.
@@ -48,6 +156,9 @@ class RagasDataCollector:
         
         # Save for evaluation
         collector.save("logs/ragas_traces/data.json")
+        
+        # Or append incrementally as JSON Lines
+        collector.drain().append("logs/ragas_traces/data.jsonl")
     """
     
     def __init__(self):
@@ -67,37 +178,10 @@ class RagasDataCollector:
         Returns:
             List of Ragas message objects
         """
-        from langchain_core.messages import HumanMessage as LCHumanMessage
-        from langchain_core.messages import AIMessage as LCAIMessage
-        from langchain_core.messages import ToolMessage as LCToolMessage
-        
-        ragas_messages = []
-        
-        for msg in messages:
-            if isinstance(msg, LCHumanMessage):
-                ragas_messages.append(HumanMessage(content=msg.content))
-            elif isinstance(msg, LCAIMessage):
-                # Extract tool calls if present
-                tool_calls = []
-                if hasattr(msg, 'tool_calls') and msg.tool_calls:
-                    for tc in msg.tool_calls:
-                        tool_calls.append(ToolCall(
-                            name=tc.get('name', ''),
-                            args=tc.get('args', {})
-                        ))
-                
-                ragas_messages.append(AIMessage(
-                    content=msg.content or "",
-                    tool_calls=tool_calls if tool_calls else None
-                ))
-            elif isinstance(msg, LCToolMessage):
-                ragas_messages.append(ToolMessage(content=msg.content))
-            else:
-                # Fallback: try to extract content
-                if hasattr(msg, 'content'):
-                    ragas_messages.append(HumanMessage(content=str(msg.content)))
-        
-        return ragas_messages
+        return [
+            ragas_message for msg in messages
+            if (ragas_message := _converter_for(type(msg))(msg)) is not None
+        ]
         
     def add_single_turn(
         self,
@@ -122,8 +206,9 @@ class RagasDataCollector:
         Raises:
             ValueError: If required fields are empty or invalid
         """
-        # Input validation
-        if not user_input or not user_input.strip():
+        # Input validation (each string is stripped once and reused)
+        user_input = user_input.strip() if user_input else ""
+        if not user_input:
             raise ValueError("user_input cannot be empty")
         
         if not isinstance(retrieved_contexts, list):
@@ -132,13 +217,15 @@ class RagasDataCollector:
         if not retrieved_contexts:
             logger.warning("No retrieved contexts provided - some metrics may be limited")
         
-        if not response or not response.strip():
+        response = response.strip() if response else ""
+        if not response:
             raise ValueError("response cannot be empty")
         
+        stripped_contexts = (ctx.strip() for ctx in retrieved_contexts if ctx)
         sample_data = {
-            "user_input": user_input.strip(),
-            "retrieved_contexts": [ctx.strip() for ctx in retrieved_contexts if ctx and ctx.strip()],
-            "response": response.strip(),
+            "user_input": user_input,
+            "retrieved_contexts": [ctx for ctx in stripped_contexts if ctx],
+            "response": response,
         }
         
         if reference:
@@ -161,6 +248,9 @@ class RagasDataCollector:
     ) -> None:
         """
         Add a multi-turn agent conversation for agentic evaluation.
+
+        The messages list is only read (converted to Ragas messages), never
+        mutated or retained, so callers can pass agent state without copying.
         
         Args:
             messages: List of LangChain messages (HumanMessage, AIMessage, ToolMessage)
@@ -207,34 +297,38 @@ class RagasDataCollector:
             
         self.multi_turn_samples.append(sample_data)
     
-    def create_single_turn_dataset(self) -> EvaluationDataset:
+    def iter_single_turn_samples(self) -> Iterator[SingleTurnSample]:
         """
-        Create Ragas EvaluationDataset from collected single-turn samples.
+        Build Ragas samples from collected single-turn data one at a time.
         
-        Returns:
-            EvaluationDataset ready for evaluation with Ragas metrics
+        Yields:
+            SingleTurnSample for each collected interaction
         """
-        samples = []
         for data in self.single_turn_samples:
-            sample = SingleTurnSample(
+            yield SingleTurnSample(
                 user_input=data["user_input"],
                 retrieved_contexts=data["retrieved_contexts"],
                 response=data["response"],
                 reference=data.get("reference"),
                 reference_contexts=data.get("reference_contexts"),
             )
-            samples.append(sample)
-            
-        return EvaluationDataset(samples=samples)
     
-    def create_multi_turn_dataset(self) -> EvaluationDataset:
+    def create_single_turn_dataset(self) -> EvaluationDataset:
         """
-        Create Ragas EvaluationDataset from collected multi-turn samples.
+        Create Ragas EvaluationDataset from collected single-turn samples.
         
         Returns:
-            EvaluationDataset ready for agent evaluation metrics
+            EvaluationDataset ready for evaluation with Ragas metrics
+        """
+        return EvaluationDataset(samples=list(self.iter_single_turn_samples()))
+    
+    def iter_multi_turn_samples(self) -> Iterator[MultiTurnSample]:
+        """
+        Build Ragas samples from collected multi-turn data one at a time.
+        
+        Yields:
+            MultiTurnSample for each collected conversation
         """
-        samples = []
         for data in self.multi_turn_samples:
             # Reconstruct ToolCall objects if present
             reference_tool_calls = None
@@ -247,44 +341,40 @@ class RagasDataCollector:
             # Reconstruct Ragas message objects from serialized data
             messages = data["messages"]
             if messages and isinstance(messages[0], dict):
-                # Messages were serialized - need to reconstruct
-                reconstructed_messages = []
-                for msg_dict in messages:
-                    msg_type = msg_dict.get("type", "").lower()
-                    content = msg_dict.get("content", "")
-                    
-                    if msg_type in ["humanmessage", "human"]:
-                        reconstructed_messages.append(HumanMessage(content=content))
-                    elif msg_type in ["aimessage", "ai"]:
-                        tool_calls_data = msg_dict.get("tool_calls")
-                        tool_calls = []
-                        if tool_calls_data:
-                            for tc in tool_calls_data:
-                                tool_calls.append(ToolCall(name=tc["name"], args=tc["args"]))
-                        reconstructed_messages.append(AIMessage(
-                            content=content or "",
-                            tool_calls=tool_calls if tool_calls else None
-                        ))
-                    elif msg_type in ["toolmessage", "tool"]:
-                        reconstructed_messages.append(ToolMessage(content=content))
-                
-                messages = reconstructed_messages
+                # Messages were serialized - need to reconstruct (unknown types are skipped).
+                # Stored back on the sample so repeated evaluations skip this step;
+                # save() serializes Ragas messages the same way it did the dicts.
+                messages = [
+                    message for msg_dict in messages
+                    if (message := _deserialize_message(msg_dict)) is not None
+                ]
+                data["messages"] = messages
             
-            sample = MultiTurnSample(
+            yield MultiTurnSample(
                 user_input=messages,
                 reference_tool_calls=reference_tool_calls,
                 reference=data.get("reference"),
             )
-            samples.append(sample)
-            
-        return EvaluationDataset(samples=samples)
     
-    def save(self, filepath: Path | str) -> None:
+    def create_multi_turn_dataset(self) -> EvaluationDataset:
+        """
+        Create Ragas EvaluationDataset from collected multi-turn samples.
+        
+        Returns:
+            EvaluationDataset ready for agent evaluation metrics
+        """
+        return EvaluationDataset(samples=list(self.iter_multi_turn_samples()))
+    
+    def save(self, filepath: Path | str, pretty: bool = False) -> None:
         """
         Save collected data to JSON file.
         
+        Output is compact by default; for append-only collection prefer
+        append(), which writes JSON Lines.
+        
         Args:
             filepath: Path to save JSON data
+            pretty: Indent the output for reading by hand (larger, slower)
             
         Raises:
             IOError: If file cannot be written
@@ -297,33 +387,14 @@ class RagasDataCollector:
         filepath = Path(filepath)
         filepath.parent.mkdir(parents=True, exist_ok=True)
         
-        # Convert Ragas messages to serializable format
-        def serialize_sample(sample: Dict[str, Any]) -> Dict[str, Any]:
-            """Convert Ragas messages to dict for JSON serialization"""
-            serialized = sample.copy()
-            if "messages" in serialized:
-                # Convert Ragas message objects to dicts
-                serialized["messages"] = [
-                    {
-                        "type": msg.__class__.__name__,
-                        "content": msg.content if hasattr(msg, "content") else None,
-                        "tool_calls": [
-                            {"name": tc.name, "args": tc.args}
-                            for tc in msg.tool_calls
-                        ] if hasattr(msg, "tool_calls") and msg.tool_calls else None,
-                    }
-                    for msg in serialized["messages"]
-                ]
-            return serialized
-        
         data = {
             "schema_version": SCHEMA_VERSION,
             "timestamp": datetime.now().isoformat(),
             "single_turn_samples": [
-                serialize_sample(s) for s in self.single_turn_samples
+                _serialize_sample(s) for s in self.single_turn_samples
             ],
             "multi_turn_samples": [
-                serialize_sample(s) for s in self.multi_turn_samples
+                _serialize_sample(s) for s in self.multi_turn_samples
             ],
             "counts": {
                 "single_turn": len(self.single_turn_samples),
@@ -332,19 +403,62 @@ class RagasDataCollector:
         }
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # orjson writes UTF-8 bytes directly (no ASCII escaping or str round-trip)
+            option = orjson.OPT_INDENT_2 if pretty else None
+            filepath.write_bytes(orjson.dumps(data, option=option))
             logger.info(f"Saved {len(self)} samples to {filepath}")
         except IOError as e:
             logger.error(f"Failed to save data to {filepath}: {e}")
             raise
     
+    def append(self, filepath: Path | str) -> int:
+        """
+        Append collected samples to a JSON Lines file, one sample per line.
+        
+        Unlike save(), the file is opened in append mode so samples can be
+        written as they are collected and survive a crash mid-run. Each line
+        carries a "sample_type" of "single_turn" or "multi_turn".
+        
+        Args:
+            filepath: Path to the .jsonl file (created if missing)
+            
+        Returns:
+            Number of samples written
+            
+        Raises:
+            IOError: If file cannot be written
+        """
+        if len(self) == 0:
+            return 0
+        
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        
+        lines = [
+            orjson.dumps({"sample_type": "single_turn", **_serialize_sample(s)})
+            for s in self.single_turn_samples
+        ] + [
+            orjson.dumps({"sample_type": "multi_turn", **_serialize_sample(s)})
+            for s in self.multi_turn_samples
+        ]
+        
+        try:
+            with filepath.open("ab") as f:
+                f.write(b"\n".join(lines) + b"\n")
+            logger.info(f"Appended {len(lines)} samples to {filepath}")
+        except IOError as e:
+            logger.error(f"Failed to append data to {filepath}: {e}")
+            raise
+        
+        return len(lines)
+    
     def load(self, filepath: Path | str) -> None:
         """
-        Load previously collected data from JSON file.
+        Load previously collected data from a JSON file, or from a JSON Lines
+        file written by append() (detected by the .jsonl suffix).
         
         Args:
-            filepath: Path to JSON file
+            filepath: Path to JSON or JSON Lines file
             
         Raises:
             FileNotFoundError: If file doesn't exist
@@ -355,10 +469,13 @@ class RagasDataCollector:
         if not filepath.exists():
             raise FileNotFoundError(f"Data file not found: {filepath}")
         
+        if filepath.suffix == ".jsonl":
+            self._load_jsonl(filepath)
+            return
+        
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            data = orjson.loads(filepath.read_bytes())
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON format in {filepath}: {e}") from e
         
         # Check schema version
@@ -375,6 +492,50 @@ class RagasDataCollector:
         
         logger.info(f"Loaded {len(self)} samples from {filepath}")
     
+    def _load_jsonl(self, filepath: Path) -> None:
+        """Load samples from a JSON Lines file written by append()"""
+        single_turn_samples = []
+        multi_turn_samples = []
+        
+        with filepath.open("rb") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    sample = orjson.loads(line)
+                except orjson.JSONDecodeError as e:
+                    raise ValueError(f"Invalid JSON on line {line_number} of {filepath}: {e}") from e
+                
+                sample_type = sample.pop("sample_type", None)
+                if sample_type == "single_turn":
+                    single_turn_samples.append(sample)
+                elif sample_type == "multi_turn":
+                    multi_turn_samples.append(sample)
+                else:
+                    raise ValueError(
+                        f"Unknown sample_type {sample_type!r} on line {line_number} of {filepath}"
+                    )
+        
+        self.single_turn_samples = single_turn_samples
+        self.multi_turn_samples = multi_turn_samples
+        
+        logger.info(f"Loaded {len(self)} samples from {filepath}")
+    
+    def drain(self) -> "RagasDataCollector":
+        """
+        Move all collected samples into a new collector and clear this one.
+        
+        Lets callers save a snapshot off the event loop (e.g. in a worker
+        thread) while new samples keep being added here.
+        
+        Returns:
+            New RagasDataCollector holding the drained samples
+        """
+        snapshot = RagasDataCollector()
+        snapshot.single_turn_samples, self.single_turn_samples = self.single_turn_samples, []
+        snapshot.multi_turn_samples, self.multi_turn_samples = self.multi_turn_samples, []
+        return snapshot
+    
     def clear(self) -> None:
         """Clear all collected samples"""
         self.single_turn_samples.clear()
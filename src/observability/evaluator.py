@@ -19,7 +19,7 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-from ragas import evaluate
+from ragas import aevaluate
 from ragas.llms import LangchainLLMWrapper
 from ragas.embeddings import LangchainEmbeddingsWrapper
 from ragas.metrics import (
@@ -38,8 +38,12 @@ from ragas.metrics import (
     TopicAdherenceScore,
 )
 
+from ragas.run_config import RunConfig
+
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 
+from src.core.config import RAGAS_EVAL_MAX_WORKERS
+
 
 def retry_on_failure(max_attempts: int = 3, delay: float = 2.0, backoff: float = 2.0):
     """
@@ -175,17 +179,20 @@ async def evaluate_agent_performance(
     evaluation_type: str = "single_turn",
     model: str = "gpt-4o-mini",
     include_reference_metrics: bool = False,
-    output_path: Optional[Path | str] = None
+    output_path: Optional[Path | str] = None,
+    max_workers: int = RAGAS_EVAL_MAX_WORKERS
 ) -> Dict[str, Any]:
     """
     Evaluate agent performance using Ragas metrics with retry logic.
     
     Args:
-        dataset_path: Path to collected data JSON file
+        dataset_path: Path to collected data JSON or JSONL file
         evaluation_type: "single_turn" for RAG or "multi_turn" for agent
         model: Model to use for evaluation (default: gpt-4o-mini)
         include_reference_metrics: Include metrics requiring reference data
         output_path: Optional path to save results
+        max_workers: Metric LLM calls to run concurrently (every sample and
+            metric is scored as a separate job on one shared executor)
         
     Returns:
         Dictionary with evaluation results
@@ -264,10 +271,12 @@ async def evaluate_agent_performance(
     eval_start = time.time()
     
     try:
-        result = evaluate(
+        # Native async: jobs share this event loop instead of a nested one
+        result = await aevaluate(
             dataset=dataset,
             metrics=metrics,
             llm=evaluator_llm,
+            run_config=RunConfig(max_workers=max_workers),
         )
         eval_duration = time.time() - eval_start
         logger.info(f"Evaluation completed in {eval_duration:.2f}s")
@@ -339,7 +348,7 @@ if __name__ == "__main__":
     parser.add_argument(
         "dataset_path",
         type=str,
-        help="Path to collected data JSON file"
+        help="Path to collected data JSON or JSONL file"
     )
     parser.add_argument(
         "--type",
@@ -364,6 +373,12 @@ if __name__ == "__main__":
         type=str,
         help="Path to save evaluation results"
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=RAGAS_EVAL_MAX_WORKERS,
+        help=f"Concurrent metric LLM calls (default: {RAGAS_EVAL_MAX_WORKERS})"
+    )
     
     args = parser.parse_args()
     
@@ -372,5 +387,6 @@ if __name__ == "__main__":
         evaluation_type=args.type,
         model=args.model,
         include_reference_metrics=args.with_reference,
-        output_path=args.output
+        output_path=args.output,
+        max_workers=args.max_workers
     ))
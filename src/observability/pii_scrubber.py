@@ -19,6 +19,15 @@ CREDIT_CARD_PATTERN = r'\b(?:\d{4}[-\s]?){3}\d{4}\b'
 IP_ADDRESS_PATTERN = r'\b(?:\d{1,3}\.){3}\d{1,3}\b'
 URL_PATTERN = r'https?://[^\s<>"{}|\\^`\[\]]+'
 
+# Compiled once; every indexed chunk passes through several of these
+_EMAIL_RE = re.compile(EMAIL_PATTERN)
+_PHONE_RE = re.compile(PHONE_PATTERN)
+_SSN_RE = re.compile(SSN_PATTERN)
+_CREDIT_CARD_RE = re.compile(CREDIT_CARD_PATTERN)
+_IP_ADDRESS_RE = re.compile(IP_ADDRESS_PATTERN)
+_URL_RE = re.compile(URL_PATTERN)
+_URL_DOMAIN_RE = re.compile(r'(https?://[^/]+)')
+
 # Replacement tokens
 REDACTED_EMAIL = '[EMAIL_REDACTED]'
 REDACTED_PHONE = '[PHONE_REDACTED]'
@@ -38,7 +47,7 @@ def scrub_email(text: str) -> str:
     Returns:
         Text with emails redacted
     """
-    return re.sub(EMAIL_PATTERN, REDACTED_EMAIL, text)
+    return _EMAIL_RE.sub(REDACTED_EMAIL, text)
 
 
 def scrub_phone(text: str) -> str:
@@ -51,7 +60,7 @@ def scrub_phone(text: str) -> str:
     Returns:
         Text with phone numbers redacted
     """
-    return re.sub(PHONE_PATTERN, REDACTED_PHONE, text)
+    return _PHONE_RE.sub(REDACTED_PHONE, text)
 
 
 def scrub_ssn(text: str) -> str:
@@ -64,7 +73,7 @@ def scrub_ssn(text: str) -> str:
     Returns:
         Text with SSNs redacted
     """
-    return re.sub(SSN_PATTERN, REDACTED_SSN, text)
+    return _SSN_RE.sub(REDACTED_SSN, text)
 
 
 def scrub_credit_card(text: str) -> str:
@@ -77,7 +86,7 @@ def scrub_credit_card(text: str) -> str:
     Returns:
         Text with credit card numbers redacted
     """
-    return re.sub(CREDIT_CARD_PATTERN, REDACTED_CC, text)
+    return _CREDIT_CARD_RE.sub(REDACTED_CC, text)
 
 
 def scrub_ip_address(text: str) -> str:
@@ -90,7 +99,7 @@ def scrub_ip_address(text: str) -> str:
     Returns:
         Text with IP addresses redacted
     """
-    return re.sub(IP_ADDRESS_PATTERN, REDACTED_IP, text)
+    return _IP_ADDRESS_RE.sub(REDACTED_IP, text)
 
 
 def scrub_url(text: str, keep_domain: bool = False) -> str:
@@ -108,13 +117,13 @@ def scrub_url(text: str, keep_domain: bool = False) -> str:
         def replace_url(match):
             url = match.group(0)
             # Extract domain
-            domain_match = re.match(r'(https?://[^/]+)', url)
+            domain_match = _URL_DOMAIN_RE.match(url)
             if domain_match:
                 return domain_match.group(1) + '/[PATH_REDACTED]'
             return REDACTED_URL
-        return re.sub(URL_PATTERN, replace_url, text)
+        return _URL_RE.sub(replace_url, text)
     else:
-        return re.sub(URL_PATTERN, REDACTED_URL, text)
+        return _URL_RE.sub(REDACTED_URL, text)
 
 
 def scrub_all_pii(
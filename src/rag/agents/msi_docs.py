@@ -12,7 +12,7 @@ Usage:
 """
 
 from pathlib import Path
-from langchain_core.tools import tool, Tool
+from langchain_core.tools import StructuredTool, Tool
 
 from src.rag.base import BaseRAGAgent
 
@@ -37,9 +37,13 @@ class MSIDocsRAGAgent(BaseRAGAgent):
         return self.project_root / "data" / "documents" / "video_manager_admin_guide.txt"
 
     def create_tool(self) -> Tool:
-        """Create the search_msi_documentation tool"""
+        """
+        Create the search_msi_documentation tool.
+
+        The tool has a native coroutine, so the async agent awaits asearch()
+        instead of LangChain falling back to running the sync search.
+        """
 
-        @tool
         def search_msi_documentation(query: str) -> str:
             """Search Motorola Solutions product documentation for information.
 
@@ -58,4 +62,10 @@ class MSIDocsRAGAgent(BaseRAGAgent):
             """
             return self.search(query)
 
-        return search_msi_documentation
+        async def asearch_msi_documentation(query: str) -> str:
+            return await self.asearch(query)
+
+        return StructuredTool.from_function(
+            func=search_msi_documentation,
+            coroutine=asearch_msi_documentation,
+        )
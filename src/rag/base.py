@@ -16,24 +16,47 @@ Usage:
 """
 
 from abc import ABC, abstractmethod
+import asyncio
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from langchain_core.tools import Tool
 from langchain_chroma import Chroma
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_openai import OpenAIEmbeddings
+import hashlib
 import logging
+import mmap
+import os
 
 from src.core.config import (
     CHUNK_SIZE,
     CHUNK_OVERLAP,
     CHUNK_SEPARATORS,
+    MIN_CHUNK_SIZE,
     VECTOR_STORE_COLLECTION_NAME,
-    CHROMA_PERSIST_DIR
+    CHROMA_PERSIST_DIR,
+    INDEX_MARKER_FILE,
+    HNSW_SPACE,
+    HNSW_MAX_NEIGHBORS,
+    HNSW_EF_CONSTRUCTION,
+    HNSW_EF_SEARCH,
+    SEARCH_FETCH_K,
+    SEARCH_MMR_LAMBDA,
+    SEARCH_CACHE_SIZE,
+    QUERY_EMBEDDING_CACHE_SIZE
 )
 from src.observability.pii_scrubber import scrub_all_pii
 
 
+def _overlap_length(previous: str, chunk: str) -> int:
+    """Length of the longest prefix of chunk that previous ends with"""
+    for size in range(min(len(previous), len(chunk)), 0, -1):
+        if previous.endswith(chunk[:size]):
+            return size
+    return 0
+
+
 class BaseRAGAgent(ABC):
     """
     Base class for custom RAG agents.
@@ -67,6 +90,12 @@ class BaseRAGAgent(ABC):
         self.scrub_ips = scrub_ips
         self.scrub_urls = scrub_urls
 
+        # Per-instance LRU cache of formatted search results
+        self._cached_search = lru_cache(maxsize=SEARCH_CACHE_SIZE)(self._retrieve)
+        # Query vectors only depend on the embedding model, so they outlive
+        # the search cache when the vector store is re-created
+        self._cached_embed_query = lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)(self._embed_query)
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -95,37 +124,108 @@ class BaseRAGAgent(ABC):
         """Where to persist the vector store"""
         return str(self.project_root / f"{CHROMA_PERSIST_DIR}_{self.name}")
 
+    @property
+    def index_marker_path(self) -> Path:
+        """Marker file recording the fingerprint of the indexed documents"""
+        return Path(self.persist_directory) / INDEX_MARKER_FILE
+
     async def initialize(self) -> None:
         """
         Initialize the vector store and index documents if needed.
         Override this method if you need custom initialization logic.
+
+        Blocking work (opening Chroma, hashing, reading and splitting the
+        document) runs in worker threads, so other startup work such as
+        loading MCP tools keeps running on the event loop.
         """
         self.logger.info(f"Initializing RAG agent: {self.name}")
 
-        # Load document content
-        doc_content = self._load_documents()
-
         # Create vector store
-        self.vector_store = Chroma(
+        self.vector_store = await asyncio.to_thread(self._create_vector_store)
+
+        # Cached results may refer to a previous vector store
+        self._cached_search.cache_clear()
+
+        # Index documents unless the marker shows they are already indexed
+        fingerprint = await asyncio.to_thread(self._document_fingerprint)
+        if self._read_index_marker() != fingerprint:
+            self.logger.info(f"Indexing documents for {self.name}...")
+            # Drop chunks from an older version of the documents
+            await asyncio.to_thread(self.vector_store.reset_collection)
+            # Only read the source document when it actually needs indexing
+            doc_content = await asyncio.to_thread(self._load_documents)
+            chunks = await asyncio.to_thread(self._split_documents, doc_content)
+            # Repeated chunks (e.g. boilerplate) are embedded once, keyed by content hash
+            unique_chunks = {self._chunk_id(chunk): chunk for chunk in chunks}
+            await self.vector_store.aadd_texts(
+                texts=list(unique_chunks.values()),
+                ids=list(unique_chunks)
+            )
+            self._write_index_marker(fingerprint)
+            self.logger.info(
+                f"Indexed {len(unique_chunks)} chunks for {self.name} "
+                f"({len(chunks) - len(unique_chunks)} duplicates skipped)"
+            )
+        else:
+            self.logger.info(f"Using existing vector store for {self.name}")
+
+        # Load the index now rather than on the first user query
+        try:
+            await asyncio.to_thread(self._warm_up)
+        except Exception as e:
+            self.logger.warning(f"Vector store warm-up failed for {self.name}: {e}")
+
+    def _warm_up(self) -> None:
+        """
+        Run one similarity search so Chroma loads its HNSW index into memory.
+        Uses a stored vector as the query, so no embeddings request is made.
+        """
+        stored = self.vector_store.get(limit=1, include=["embeddings"])["embeddings"]
+        if len(stored):
+            self.vector_store.similarity_search_by_vector(stored[0], k=1)
+
+    def _create_vector_store(self) -> Chroma:
+        """
+        Create the persistent vector store for this agent.
+        Override to back the agent with a different vector store.
+        """
+        return Chroma(
             collection_name=self.collection_name,
             embedding_function=self.embeddings,
             persist_directory=self.persist_directory,
+            collection_configuration=self._hnsw_configuration(),
         )
 
-        # Index documents if collection is empty
-        if self.vector_store._collection.count() == 0:
-            self.logger.info(f"Indexing documents for {self.name}...")
-            chunks = self._split_documents(doc_content)
-            self.vector_store.add_texts(texts=chunks)
-            self.logger.info(f"Indexed {len(chunks)} chunks for {self.name}")
-        else:
-            self.logger.info(f"Using existing vector store for {self.name}")
+    @staticmethod
+    def _hnsw_configuration() -> dict:
+        """
+        HNSW index parameters for new collections.
+        Chroma keeps an existing collection's parameters, so they are part of
+        the document fingerprint and a change re-creates the collection.
+        """
+        return {
+            "hnsw": {
+                "space": HNSW_SPACE,
+                "max_neighbors": HNSW_MAX_NEIGHBORS,
+                "ef_construction": HNSW_EF_CONSTRUCTION,
+                "ef_search": HNSW_EF_SEARCH,
+            }
+        }
 
     def _load_documents(self) -> str:
-        """Load document content from file. Override for custom loading logic."""
+        """
+        Load document content from file. Override for custom loading logic.
+
+        The file is memory-mapped and decoded straight from the mapping, so
+        the raw bytes are never copied onto the Python heap.
+        """
         try:
-            with open(self.document_path, "r", encoding="utf-8") as f:
-                return f.read()
+            with open(self.document_path, "rb") as f:
+                # mmap cannot map an empty file
+                if os.fstat(f.fileno()).st_size == 0:
+                    return ""
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return str(mm, "utf-8")
         except FileNotFoundError:
             self.logger.error(f"Document not found: {self.document_path}")
             raise
@@ -133,6 +233,42 @@ class BaseRAGAgent(ABC):
             self.logger.exception(f"Failed to load document from {self.document_path}")
             raise
 
+    def _document_fingerprint(self) -> str:
+        """
+        Hash the source document, chunking settings, embedding model and
+        HNSW parameters. A change to any of them invalidates the existing index.
+        """
+        try:
+            with open(self.document_path, "rb") as f:
+                digest = hashlib.file_digest(f, "sha256")
+        except FileNotFoundError:
+            self.logger.error(f"Document not found: {self.document_path}")
+            raise
+        digest.update(f"{CHUNK_SIZE}:{CHUNK_OVERLAP}:{CHUNK_SEPARATORS}:{MIN_CHUNK_SIZE}".encode("utf-8"))
+        # Vectors from a different model or size cannot be compared with new queries
+        model = getattr(self.embeddings, "model", None)
+        dimensions = getattr(self.embeddings, "dimensions", None)
+        digest.update(f"{model}:{dimensions}".encode("utf-8"))
+        digest.update(repr(self._hnsw_configuration()).encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _chunk_id(chunk: str) -> str:
+        """Stable vector store id for a chunk, derived from its content"""
+        return hashlib.blake2b(chunk.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _read_index_marker(self) -> Optional[str]:
+        """Return the fingerprint stored in the index marker, if any"""
+        try:
+            return self.index_marker_path.read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            return None
+
+    def _write_index_marker(self, fingerprint: str) -> None:
+        """Record that the documents with this fingerprint are indexed"""
+        self.index_marker_path.parent.mkdir(parents=True, exist_ok=True)
+        self.index_marker_path.write_text(fingerprint, encoding="utf-8")
+
     def _split_documents(self, content: str) -> List[str]:
         """Split documents into chunks. Override for custom splitting logic."""
         text_splitter = RecursiveCharacterTextSplitter(
@@ -140,17 +276,77 @@ class BaseRAGAgent(ABC):
             chunk_overlap=CHUNK_OVERLAP,
             separators=CHUNK_SEPARATORS,
         )
-        return text_splitter.split_text(content)
+        return self._merge_small_chunks(text_splitter.split_text(content))
+
+    @staticmethod
+    def _merge_small_chunks(chunks: List[str]) -> List[str]:
+        """
+        Fold chunks shorter than MIN_CHUNK_SIZE into the previous chunk.
+
+        The splitter leaves short fragments at section ends, mostly repeating
+        the previous chunk's overlap. They take up retrieval slots while adding
+        little, so they are appended to the previous chunk (without repeating
+        the overlap) as long as the result stays within 110% of CHUNK_SIZE.
+        """
+        merged: List[str] = []
+        for chunk in chunks:
+            if merged and len(chunk) < MIN_CHUNK_SIZE:
+                previous = merged[-1]
+                overlap = _overlap_length(previous, chunk)
+                combined = previous + chunk[overlap:] if overlap else f"{previous}\n{chunk}"
+                if len(combined) <= CHUNK_SIZE * 1.1:
+                    merged[-1] = combined
+                    continue
+            merged.append(chunk)
+        return merged
 
     def search(self, query: str, k: int = 2) -> str:
         """
         Search the vector store for relevant documents.
         Override this method for custom search logic.
+
+        Results are cached per normalized query, so repeated questions skip
+        the embedding request and the vector store lookup.
+        """
+        if not self.vector_store:
+            raise RuntimeError(f"RAG agent {self.name} not initialized. Call initialize() first.")
+
+        return self._cached_search(self._normalize_query(query), k)
+
+    async def asearch(self, query: str, k: int = 2) -> str:
+        """
+        Async variant of search().
+
+        Chroma has no native async search (its asimilarity_search is an
+        executor wrapper), so the cached sync search runs in a worker thread
+        and the event loop stays free while embeddings and Chroma respond.
         """
         if not self.vector_store:
             raise RuntimeError(f"RAG agent {self.name} not initialized. Call initialize() first.")
 
-        retrieved_docs = self.vector_store.similarity_search(query, k=k)
+        return await asyncio.to_thread(self.search, query, k)
+
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Normalize a query so trivially different spellings share a cache entry"""
+        # Case and extra whitespace (including newlines) don't change what is being asked
+        return " ".join(query.casefold().split())
+
+    def _embed_query(self, query: str) -> Tuple[float, ...]:
+        """Embed a query (uncached). Returns a tuple so it can be cached."""
+        return tuple(self.embeddings.embed_query(query))
+
+    def _retrieve(self, query: str, k: int) -> str:
+        """Run the similarity search and format the results (uncached)"""
+        query_vector = list(self._cached_embed_query(query))
+        # MMR skips near-duplicate chunks (e.g. overlapping neighbours), so the
+        # k excerpts sent to the LLM don't repeat each other
+        retrieved_docs = self.vector_store.max_marginal_relevance_search_by_vector(
+            query_vector,
+            k=k,
+            fetch_k=SEARCH_FETCH_K,
+            lambda_mult=SEARCH_MMR_LAMBDA
+        )
 
         if not retrieved_docs:
             return "No relevant documentation found for this query."
@@ -0,0 +1,71 @@
+"""
+Concurrent OpenAI embeddings for MSI AI Assistant.
+
+OpenAIEmbeddings sends its batches to the API one after another, so indexing a
+large corpus is dominated by sequential HTTPS round-trips. This subclass splits
+the input into batches up front and sends them concurrently, bounded by
+max_concurrency to stay within OpenAI rate limits.
+
+Usage:
+    from src.rag.embeddings import ConcurrentOpenAIEmbeddings
+
+    embeddings = ConcurrentOpenAIEmbeddings(model="text-embedding-3-small", max_concurrency=5)
+    vectors = await embeddings.aembed_documents(chunks)
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
+
+from langchain_openai import OpenAIEmbeddings
+
+
+class ConcurrentOpenAIEmbeddings(OpenAIEmbeddings):
+    """
+    OpenAIEmbeddings that embeds batches concurrently.
+
+    Results are returned in input order. Inputs that fit in a single batch are
+    passed straight through to OpenAIEmbeddings.
+    """
+
+    max_concurrency: int = 5
+    """Maximum number of embedding requests in flight at once"""
+
+    def _batches(self, texts: List[str], chunk_size: Optional[int]) -> List[List[str]]:
+        """Split texts into request-sized batches"""
+        size = chunk_size or self.chunk_size
+        return [texts[i:i + size] for i in range(0, len(texts), size)]
+
+    def embed_documents(
+        self, texts: List[str], chunk_size: Optional[int] = None, **kwargs: Any
+    ) -> List[List[float]]:
+        """Embed documents, sending batches from a bounded thread pool"""
+        batches = self._batches(texts, chunk_size)
+        if len(batches) <= 1:
+            return super().embed_documents(texts, chunk_size=chunk_size, **kwargs)
+
+        embed_batch = super().embed_documents
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            results = executor.map(
+                lambda batch: embed_batch(batch, chunk_size=chunk_size, **kwargs),
+                batches
+            )
+            return [embedding for batch in results for embedding in batch]
+
+    async def aembed_documents(
+        self, texts: List[str], chunk_size: Optional[int] = None, **kwargs: Any
+    ) -> List[List[float]]:
+        """Embed documents, sending batches concurrently with asyncio.gather"""
+        batches = self._batches(texts, chunk_size)
+        if len(batches) <= 1:
+            return await super().aembed_documents(texts, chunk_size=chunk_size, **kwargs)
+
+        embed_batch = super().aembed_documents
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await embed_batch(batch, chunk_size=chunk_size, **kwargs)
+
+        results = await asyncio.gather(*(run(batch) for batch in batches))
+        return [embedding for batch in results for embedding in batch]
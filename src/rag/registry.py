@@ -15,6 +15,7 @@ Usage:
 
 from pathlib import Path
 from typing import List, Optional
+import asyncio
 from langchain_core.tools import Tool
 from langchain_openai import OpenAIEmbeddings
 import logging
@@ -45,13 +46,9 @@ class RAGAgentRegistry:
         self.logger.info(f"Registered RAG agent: {agent.name}")
 
     async def get_all_tools(self) -> List[Tool]:
-        """Initialize all agents and return their tools"""
-        tools = []
-        for agent in self._agents:
-            await agent.initialize()
-            tool = agent.create_tool()
-            tools.append(tool)
-        return tools
+        """Initialize all agents concurrently and return their tools (in registration order)"""
+        await asyncio.gather(*(agent.initialize() for agent in self._agents))
+        return [agent.create_tool() for agent in self._agents]
 
     def get_agent(self, name: str) -> Optional[BaseRAGAgent]:
         """Get a specific agent by name"""
@@ -0,0 +1,93 @@
+"""
+Unit tests for the in-memory TTL cache.
+
+Tests lookup, expiry, LRU eviction, and purging.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.core.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test suite for TTLCache"""
+
+    @pytest.fixture
+    def clock(self):
+        """Patch the monotonic clock used by the cache"""
+        with patch("src.core.cache.time.monotonic", return_value=1000.0) as mock_clock:
+            yield mock_clock
+
+    def test_set_and_get(self, clock):
+        """Test stored values are returned"""
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert len(cache) == 1
+
+    def test_get_missing_returns_default(self, clock):
+        """Test missing keys return the default"""
+        cache = TTLCache(maxsize=2, ttl=10)
+
+        assert cache.get("missing") is None
+        assert cache.get("missing", "default") == "default"
+        assert "missing" not in cache
+
+    def test_contains_with_none_value(self, clock):
+        """Test None values still count as present"""
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", None)
+
+        assert "a" in cache
+
+    def test_entries_expire(self, clock):
+        """Test entries are dropped once their ttl has passed"""
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+
+        clock.return_value = 1010.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, clock):
+        """Test the least recently used entry is evicted when full"""
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_pop(self, clock):
+        """Test pop removes and returns the entry"""
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        assert len(cache) == 0
+
+    def test_purge_expired(self, clock):
+        """Test purge_expired removes only expired entries"""
+        cache = TTLCache(maxsize=3, ttl=10)
+        cache.set("a", 1)
+        clock.return_value = 1005.0
+        cache.set("b", 2)
+
+        clock.return_value = 1012.0
+        assert cache.purge_expired() == 1
+        assert "a" not in cache
+        assert "b" in cache
+
+    def test_invalid_arguments(self):
+        """Test maxsize and ttl must be positive"""
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=0, ttl=10)
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=1, ttl=0)
@@ -0,0 +1,67 @@
+"""
+Unit tests for agent middleware.
+
+Tests that tool schemas are precomputed and swapped into model requests.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from langchain.agents.middleware import ModelRequest
+from langchain_core.tools import tool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from src.core.middleware import ToolSchemaCacheMiddleware
+
+
+@tool
+def search_docs(query: str) -> str:
+    """Search the documentation"""
+    return query
+
+
+@tool
+def list_tickets() -> str:
+    """List open tickets"""
+    return ""
+
+
+class TestToolSchemaCacheMiddleware:
+    """Test suite for ToolSchemaCacheMiddleware"""
+
+    @pytest.fixture
+    def middleware(self):
+        """Middleware caching the search_docs schema only"""
+        return ToolSchemaCacheMiddleware([search_docs])
+
+    @pytest.fixture
+    def request_(self):
+        """Model request with a cached tool, an uncached tool and a built-in tool"""
+        return ModelRequest(
+            model=MagicMock(),
+            messages=[],
+            tools=[search_docs, list_tickets, {"type": "web_search"}],
+        )
+
+    def test_precomputes_schemas(self, middleware):
+        """Test schemas match what the model would build itself"""
+        assert middleware.schemas == {"search_docs": convert_to_openai_tool(search_docs)}
+
+    def test_wrap_model_call_swaps_cached_tools(self, middleware, request_):
+        """Test cached tools are replaced and others pass through"""
+        handler = MagicMock(return_value="response")
+
+        assert middleware.wrap_model_call(request_, handler) == "response"
+
+        tools = handler.call_args.args[0].tools
+        assert tools == [middleware.schemas["search_docs"], list_tickets, {"type": "web_search"}]
+        assert request_.tools[0] is search_docs
+
+    async def test_awrap_model_call_swaps_cached_tools(self, middleware, request_):
+        """Test the async path swaps tools the same way"""
+        async def handler(request):
+            return request.tools
+
+        tools = await middleware.awrap_model_call(request_, handler)
+
+        assert tools[0] == middleware.schemas["search_docs"]
+        assert tools[1] is list_tickets
@@ -0,0 +1,55 @@
+"""
+Unit tests for MCP token verification.
+
+Tests that verified tokens are cached and that invalid or expired tokens are not reused.
+"""
+
+import time
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastmcp.server.auth.providers.jwt import JWTVerifier
+from mcp.server.auth.provider import AccessToken
+
+from src.mcp.auth import CachedJWTVerifier
+
+
+def make_access_token(expires_at):
+    return AccessToken(token="token", client_id="james_smith", scopes=[], expires_at=expires_at)
+
+
+class TestCachedJWTVerifier:
+    """Test suite for CachedJWTVerifier"""
+
+    @pytest.fixture
+    def verifier(self):
+        """Verifier with a static public key (no JWKS lookups)"""
+        return CachedJWTVerifier(public_key="unused", issuer="issuer", audience="audience")
+
+    async def test_reuses_verified_token(self, verifier):
+        """Test the signature is only checked on the first call"""
+        access_token = make_access_token(int(time.time()) + 300)
+
+        with patch.object(JWTVerifier, "verify_token", AsyncMock(return_value=access_token)) as verify:
+            assert await verifier.verify_token("token") is access_token
+            assert await verifier.verify_token("token") is access_token
+
+        verify.assert_awaited_once()
+
+    async def test_does_not_cache_invalid_token(self, verifier):
+        """Test rejected tokens are verified again on every call"""
+        with patch.object(JWTVerifier, "verify_token", AsyncMock(return_value=None)) as verify:
+            assert await verifier.verify_token("bad") is None
+            assert await verifier.verify_token("bad") is None
+
+        assert verify.await_count == 2
+
+    async def test_reverifies_expired_token(self, verifier):
+        """Test a cached token past its own exp is not returned"""
+        expired = make_access_token(int(time.time()) - 1)
+
+        with patch.object(JWTVerifier, "verify_token", AsyncMock(side_effect=[expired, None])) as verify:
+            assert await verifier.verify_token("token") is expired
+            assert await verifier.verify_token("token") is None
+
+        assert verify.await_count == 2
@@ -0,0 +1,73 @@
+"""
+Unit tests for MCP SQLite connection pooling.
+
+Tests that connections are reused and that the async helpers query off the event loop.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from src.mcp.db import ConnectionPool
+
+
+@pytest.fixture
+def pool(tmp_path):
+    """Pool over a small users database"""
+    pool = ConnectionPool(tmp_path / "users.db")
+    with pool.connection() as connection:
+        connection.execute("CREATE TABLE users (username TEXT NOT NULL UNIQUE, organization TEXT NOT NULL)")
+        connection.executemany(
+            "INSERT INTO users VALUES (?, ?)",
+            [("james_smith", "Dallas_Police"), ("paul_morgan", "Allen_Firestation")]
+        )
+        connection.commit()
+    return pool
+
+
+class TestConnectionPool:
+    """Test suite for ConnectionPool"""
+
+    def test_reuses_connection(self, pool):
+        """Test a returned connection is handed out again"""
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            assert second is first
+
+    def test_rolls_back_uncommitted_changes(self, pool):
+        """Test changes left uncommitted are not seen by the next borrower"""
+        with pool.connection() as connection:
+            connection.execute("DELETE FROM users")
+
+        with pool.connection() as connection:
+            assert connection.execute("SELECT COUNT(*) FROM users").fetchone() == (2,)
+
+    async def test_fetchone(self, pool):
+        """Test fetchone returns the first row or None"""
+        query = "SELECT organization FROM users WHERE username = ?"
+
+        assert await pool.fetchone(query, ("james_smith",)) == ("Dallas_Police",)
+        assert await pool.fetchone(query, ("nobody",)) is None
+
+    async def test_fetchall_row_factory(self, pool):
+        """Test fetchall returns tuples by default and honours row_factory"""
+        query = "SELECT username, organization FROM users ORDER BY username"
+
+        assert await pool.fetchall(query) == [
+            ("james_smith", "Dallas_Police"),
+            ("paul_morgan", "Allen_Firestation"),
+        ]
+        rows = await pool.fetchall(query, row_factory=sqlite3.Row)
+        assert dict(rows[0]) == {"username": "james_smith", "organization": "Dallas_Police"}
+
+    async def test_run_uses_worker_thread(self, pool):
+        """Test run calls the work function off the event loop thread"""
+        def insert(connection):
+            connection.execute("INSERT INTO users VALUES ('terry_jobs', 'Dallas_Police')")
+            connection.commit()
+            return threading.get_ident()
+
+        assert await pool.run(insert) != threading.get_ident()
+        assert await pool.fetchone("SELECT COUNT(*) FROM users") == (3,)
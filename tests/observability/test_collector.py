@@ -9,7 +9,7 @@ import json
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
+from langchain_core.messages import HumanMessage, AIMessage, AIMessageChunk, SystemMessage, ToolMessage
 from ragas.messages import ToolCall
 
 from src.observability.collector import RagasDataCollector, SCHEMA_VERSION
@@ -107,14 +107,14 @@ class TestRagasDataCollector:
         
         collector.add_single_turn(
             user_input="  Query  ",
-            retrieved_contexts=["  Context 1  ", "  Context 2  "],
+            retrieved_contexts=["  Context 1  ", "   ", "", "  Context 2  "],
             response="  Response  "
         )
         
         sample = collector.single_turn_samples[0]
         assert sample["user_input"] == "Query"
         assert sample["response"] == "Response"
-        assert all(ctx.strip() == ctx for ctx in sample["retrieved_contexts"])
+        assert sample["retrieved_contexts"] == ["Context 1", "Context 2"]
     
     def test_add_multi_turn_valid(self):
         """Test adding valid multi-turn sample"""
@@ -133,6 +133,41 @@ class TestRagasDataCollector:
         assert len(collector.multi_turn_samples) == 1
         assert len(collector.multi_turn_samples[0]["messages"]) == 4
     
+    def test_add_multi_turn_does_not_mutate_messages(self):
+        """Test the caller's message list is neither mutated nor retained"""
+        collector = RagasDataCollector()
+
+        messages = [
+            HumanMessage(content="How do I add a user?"),
+            AIMessage(content="To add a user, follow these steps...")
+        ]
+        original = list(messages)
+
+        collector.add_multi_turn(messages=messages)
+
+        assert messages == original
+        assert collector.multi_turn_samples[0]["messages"] is not messages
+
+    def test_add_multi_turn_converts_message_subclasses(self):
+        """Test message subclasses convert like their base class and unknown types fall back"""
+        collector = RagasDataCollector()
+
+        messages = [
+            SystemMessage(content="You are helpful"),
+            AIMessageChunk(
+                content="",
+                tool_calls=[{"name": "search", "args": {"query": "users"}, "id": "call_1"}]
+            ),
+        ]
+
+        collector.add_multi_turn(messages=messages)
+
+        system, ai = collector.multi_turn_samples[0]["messages"]
+        assert type(system).__name__ == "HumanMessage"
+        assert system.content == "You are helpful"
+        assert type(ai).__name__ == "AIMessage"
+        assert ai.tool_calls[0].name == "search"
+    
     def test_add_multi_turn_with_tool_calls(self):
         """Test multi-turn sample with AI message containing tool calls"""
         collector = RagasDataCollector()
@@ -224,6 +259,112 @@ class TestRagasDataCollector:
             assert len(new_collector.single_turn_samples) == 1
             assert len(new_collector.multi_turn_samples) == 1
     
+    def test_save_writes_unescaped_utf8(self):
+        """Test non-ASCII text is written as UTF-8 rather than escaped"""
+        collector = RagasDataCollector()
+        collector.add_single_turn(
+            user_input="¿Cómo agrego un usuario?",
+            retrieved_contexts=["Contexto"],
+            response="Vaya a Administración"
+        )
+
+        with TemporaryDirectory() as tmpdir:
+            filepath = Path(tmpdir) / "utf8.json"
+            collector.save(filepath)
+
+            raw = filepath.read_text(encoding="utf-8")
+            assert "¿Cómo agrego un usuario?" in raw
+            assert "\\u" not in raw
+
+            loaded = RagasDataCollector()
+            loaded.load(filepath)
+            assert loaded.single_turn_samples[0]["user_input"] == "¿Cómo agrego un usuario?"
+
+    def test_save_compact_by_default(self):
+        """Test save writes compact JSON unless pretty output is requested"""
+        collector = RagasDataCollector()
+        collector.add_single_turn(
+            user_input="Test query",
+            retrieved_contexts=["Context 1"],
+            response="Test response"
+        )
+
+        with TemporaryDirectory() as tmpdir:
+            compact = Path(tmpdir) / "compact.json"
+            pretty = Path(tmpdir) / "pretty.json"
+            collector.save(compact)
+            collector.save(pretty, pretty=True)
+
+            assert "\n" not in compact.read_text(encoding="utf-8")
+            assert '\n  "schema_version"' in pretty.read_text(encoding="utf-8")
+
+            loaded = RagasDataCollector()
+            loaded.load(compact)
+            assert loaded.single_turn_samples == collector.single_turn_samples
+
+    def test_append_and_load_jsonl_roundtrip(self):
+        """Test append writes one line per sample and load reads them back"""
+        collector = RagasDataCollector()
+        collector.add_single_turn(
+            user_input="Test query",
+            retrieved_contexts=["Context 1"],
+            response="Test response"
+        )
+        
+        with TemporaryDirectory() as tmpdir:
+            filepath = Path(tmpdir) / "test_data.jsonl"
+            assert collector.drain().append(filepath) == 1
+            
+            # A second append adds to the file rather than overwriting it
+            collector.add_multi_turn(messages=[
+                HumanMessage(content="Hello"),
+                AIMessage(content="Hi there")
+            ])
+            assert collector.drain().append(filepath) == 1
+            
+            lines = filepath.read_text(encoding="utf-8").splitlines()
+            assert [json.loads(line)["sample_type"] for line in lines] == ["single_turn", "multi_turn"]
+            
+            new_collector = RagasDataCollector()
+            new_collector.load(filepath)
+            
+            assert len(new_collector.single_turn_samples) == 1
+            assert len(new_collector.multi_turn_samples) == 1
+            assert "sample_type" not in new_collector.single_turn_samples[0]
+            assert new_collector.multi_turn_samples[0]["messages"][1]["content"] == "Hi there"
+
+    def test_save_loaded_multi_turn_samples(self):
+        """Test samples read back by load() can be saved again unchanged"""
+        collector = RagasDataCollector()
+        collector.add_multi_turn(messages=[
+            HumanMessage(content="Hello"),
+            AIMessage(content="Hi there")
+        ])
+
+        with TemporaryDirectory() as tmpdir:
+            first = Path(tmpdir) / "first.jsonl"
+            second = Path(tmpdir) / "second.json"
+            collector.append(first)
+
+            loaded = RagasDataCollector()
+            loaded.load(first)
+            loaded.save(second)
+
+            resaved = RagasDataCollector()
+            resaved.load(second)
+            assert resaved.multi_turn_samples == loaded.multi_turn_samples
+
+    def test_load_invalid_jsonl(self):
+        """Test loading a malformed JSON Lines file raises ValueError"""
+        collector = RagasDataCollector()
+        
+        with TemporaryDirectory() as tmpdir:
+            filepath = Path(tmpdir) / "invalid.jsonl"
+            filepath.write_text('{"sample_type": "single_turn"}\nNot valid JSON{\n')
+            
+            with pytest.raises(ValueError, match="line 2"):
+                collector.load(filepath)
+    
     def test_save_includes_schema_version(self):
         """Test that saved file includes schema version"""
         collector = RagasDataCollector()
@@ -340,7 +481,58 @@ class TestRagasDataCollector:
         assert len(dataset) == 2
         from ragas.dataset_schema import MultiTurnSample
         assert all(isinstance(s, MultiTurnSample) for s in dataset.samples)
-    
+
+    def test_create_multi_turn_dataset_from_loaded_messages(self):
+        """Test serialized messages are rebuilt as Ragas messages and unknown types skipped"""
+        collector = RagasDataCollector()
+        collector.multi_turn_samples = [{"messages": [
+            {"type": "HumanMessage", "content": "Search for users", "tool_calls": None},
+            {"type": "AIMessage", "content": "", "tool_calls": [{"name": "search", "args": {"q": "users"}}]},
+            {"type": "SystemMessage", "content": "ignored", "tool_calls": None},
+            {"type": "ToolMessage", "content": "User docs", "tool_calls": None},
+        ]}]
+
+        messages = collector.create_multi_turn_dataset().samples[0].user_input
+
+        assert [type(m).__name__ for m in messages] == ["HumanMessage", "AIMessage", "ToolMessage"]
+        assert messages[1].tool_calls[0].args == {"q": "users"}
+
+    def test_create_multi_turn_dataset_reuses_reconstructed_messages(self):
+        """Test loaded messages are rebuilt once and still save in the same format"""
+        collector = RagasDataCollector()
+        serialized = [
+            {"type": "HumanMessage", "content": "Hello", "tool_calls": None},
+            {"type": "AIMessage", "content": "Hi there", "tool_calls": None},
+        ]
+        collector.multi_turn_samples = [{"messages": list(serialized)}]
+
+        first = collector.create_multi_turn_dataset().samples[0].user_input
+        second = collector.create_multi_turn_dataset().samples[0].user_input
+        assert all(a is b for a, b in zip(first, second))
+
+        with TemporaryDirectory() as tmpdir:
+            filepath = Path(tmpdir) / "data.json"
+            collector.save(filepath)
+            saved = json.loads(filepath.read_text(encoding="utf-8"))
+            assert saved["multi_turn_samples"][0]["messages"] == serialized
+
+    def test_iter_samples_builds_lazily(self):
+        """Test sample iterators build one Ragas sample per step"""
+        collector = RagasDataCollector()
+        collector.add_single_turn(
+            user_input="Query",
+            retrieved_contexts=["Context"],
+            response="Response"
+        )
+        collector.add_multi_turn(messages=[HumanMessage(content="Query")])
+
+        single = collector.iter_single_turn_samples()
+        assert next(single).user_input == "Query"
+        assert next(single, None) is None
+
+        multi = list(collector.iter_multi_turn_samples())
+        assert multi[0].user_input[0].content == "Query"
+
     def test_clear(self):
         """Test clearing all collected samples"""
         collector = RagasDataCollector()
@@ -362,6 +554,27 @@ class TestRagasDataCollector:
         assert len(collector.single_turn_samples) == 0
         assert len(collector.multi_turn_samples) == 0
     
+    def test_drain(self):
+        """Test draining moves samples into a new collector"""
+        collector = RagasDataCollector()
+        
+        collector.add_single_turn(
+            user_input="Query",
+            retrieved_contexts=["Context"],
+            response="Response"
+        )
+        collector.add_multi_turn(messages=[HumanMessage(content="Hello")])
+        
+        snapshot = collector.drain()
+        
+        assert len(snapshot) == 2
+        assert len(collector) == 0
+        
+        # New samples go to the original collector only
+        collector.add_multi_turn(messages=[HumanMessage(content="Again")])
+        assert len(collector) == 1
+        assert len(snapshot) == 2
+    
     def test_repr(self):
         """Test string representation"""
         collector = RagasDataCollector()
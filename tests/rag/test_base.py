@@ -7,7 +7,7 @@ Tests document loading, chunking, vector store initialization, and search.
 import pytest
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from langchain_core.tools import Tool
 from langchain_chroma import Chroma
 
@@ -105,6 +105,15 @@ class TestBaseRAGAgent:
             with pytest.raises(FileNotFoundError):
                 agent._load_documents()
 
+    def test_load_documents_empty_file(self, mock_embeddings):
+        """Test loading an empty document returns an empty string"""
+        with TemporaryDirectory() as tmpdir:
+            empty_path = Path(tmpdir) / "empty.txt"
+            empty_path.write_text("")
+            agent = MockRAGAgent(Path(tmpdir), mock_embeddings, empty_path)
+
+            assert agent._load_documents() == ""
+
     def test_split_documents(self, mock_agent):
         """Test document splitting into chunks"""
         content = "This is a test document. " * 100  # Create long content
@@ -129,15 +138,27 @@ class TestBaseRAGAgent:
         assert len(chunks) == 1
         assert chunks[0] == content
 
+    def test_merge_small_chunks_drops_repeated_overlap(self, mock_agent):
+        """Test a short trailing chunk is folded into the chunk it overlaps"""
+        previous = "A" * 500 + "\nClick Save."
+        fragment = "Click Save.\nThe user is created."
+
+        assert mock_agent._merge_small_chunks([previous, fragment]) == [
+            previous + "\nThe user is created."
+        ]
+
+    def test_merge_small_chunks_respects_size_limit(self, mock_agent):
+        """Test chunks are kept apart when merging would exceed the size limit"""
+        chunks = ["A" * 1755, "Short fragment", "B" * 600]
+
+        assert mock_agent._merge_small_chunks(chunks) == chunks
+
     @patch('src.rag.base.Chroma')
     async def test_initialize_new_vector_store(self, mock_chroma_class, mock_agent):
         """Test initialization with empty vector store"""
-        # Setup mock
+        # Setup mock (no index marker yet)
         mock_vector_store = MagicMock()
-        mock_collection = MagicMock()
-        mock_collection.count.return_value = 0  # Empty collection
-        mock_vector_store._collection = mock_collection
-        mock_vector_store.add_texts = Mock()
+        mock_vector_store.aadd_texts = AsyncMock()
         mock_chroma_class.return_value = mock_vector_store
         
         await mock_agent.initialize()
@@ -147,27 +168,131 @@ class TestBaseRAGAgent:
         mock_chroma_class.assert_called_once()
         
         # Verify documents were indexed
-        mock_vector_store.add_texts.assert_called_once()
-        call_args = mock_vector_store.add_texts.call_args
+        mock_vector_store.aadd_texts.assert_awaited_once()
+        call_args = mock_vector_store.aadd_texts.call_args
         texts = call_args.kwargs['texts']
         assert len(texts) > 0
 
+        # Verify the marker records what was indexed
+        assert mock_agent._read_index_marker() == mock_agent._document_fingerprint()
+
+    @patch('src.rag.base.Chroma')
+    async def test_initialize_skips_duplicate_chunks(self, mock_chroma_class, mock_agent):
+        """Test identical chunks are embedded once under their content hash"""
+        mock_vector_store = MagicMock()
+        mock_vector_store.aadd_texts = AsyncMock()
+        mock_chroma_class.return_value = mock_vector_store
+
+        with patch.object(mock_agent, '_split_documents', return_value=["Header", "Body", "Header"]):
+            await mock_agent.initialize()
+
+        mock_vector_store.aadd_texts.assert_awaited_once_with(
+            texts=["Header", "Body"],
+            ids=[mock_agent._chunk_id("Header"), mock_agent._chunk_id("Body")]
+        )
+
     @patch('src.rag.base.Chroma')
     async def test_initialize_existing_vector_store(self, mock_chroma_class, mock_agent):
         """Test initialization with existing vector store"""
         # Setup mock for existing collection
+        mock_agent._write_index_marker(mock_agent._document_fingerprint())
         mock_vector_store = MagicMock()
-        mock_collection = MagicMock()
-        mock_collection.count.return_value = 10  # Has documents
-        mock_vector_store._collection = mock_collection
-        mock_vector_store.add_texts = Mock()
+        mock_vector_store.aadd_texts = AsyncMock()
         mock_chroma_class.return_value = mock_vector_store
         
         await mock_agent.initialize()
         
         # Verify vector store was created but NOT indexed
         assert mock_agent.vector_store is not None
-        mock_vector_store.add_texts.assert_not_called()
+        mock_vector_store.aadd_texts.assert_not_called()
+
+    @patch('src.rag.base.Chroma')
+    async def test_initialize_warms_up_with_stored_vector(self, mock_chroma_class, mock_agent):
+        """Test startup runs one search with a stored vector and no embeddings request"""
+        mock_agent._write_index_marker(mock_agent._document_fingerprint())
+        mock_vector_store = MagicMock()
+        mock_vector_store.get.return_value = {"embeddings": [[0.5] * 768]}
+        mock_chroma_class.return_value = mock_vector_store
+
+        await mock_agent.initialize()
+
+        mock_vector_store.similarity_search_by_vector.assert_called_once_with([0.5] * 768, k=1)
+        mock_agent.embeddings.embed_query.assert_not_called()
+
+    @patch('src.rag.base.Chroma')
+    async def test_initialize_ignores_warm_up_failure(self, mock_chroma_class, mock_agent):
+        """Test a failed warm-up does not fail initialization"""
+        mock_agent._write_index_marker(mock_agent._document_fingerprint())
+        mock_vector_store = MagicMock()
+        mock_vector_store.get.side_effect = RuntimeError("index unavailable")
+        mock_chroma_class.return_value = mock_vector_store
+
+        await mock_agent.initialize()
+
+        assert mock_agent.vector_store is mock_vector_store
+
+    @patch('src.rag.base.Chroma')
+    async def test_initialize_existing_vector_store_skips_loading(self, mock_chroma_class, mock_agent):
+        """Test the source document is not read when the index already exists"""
+        mock_agent._write_index_marker(mock_agent._document_fingerprint())
+        mock_chroma_class.return_value = MagicMock()
+
+        with patch.object(mock_agent, '_load_documents') as mock_load:
+            await mock_agent.initialize()
+
+        mock_load.assert_not_called()
+
+    @patch('src.rag.base.Chroma')
+    async def test_initialize_reindexes_changed_document(self, mock_chroma_class, mock_agent):
+        """Test a stale marker triggers a fresh index of the changed document"""
+        mock_agent._write_index_marker(mock_agent._document_fingerprint())
+        mock_agent.document_path.write_text("Updated document content.")
+
+        mock_vector_store = MagicMock()
+        mock_vector_store.aadd_texts = AsyncMock()
+        mock_chroma_class.return_value = mock_vector_store
+
+        await mock_agent.initialize()
+
+        mock_vector_store.reset_collection.assert_called_once()
+        mock_vector_store.aadd_texts.assert_awaited_once_with(
+            texts=["Updated document content."],
+            ids=[mock_agent._chunk_id("Updated document content.")]
+        )
+        assert mock_agent._read_index_marker() == mock_agent._document_fingerprint()
+
+    @patch('src.rag.base.Chroma')
+    async def test_initialize_reindexes_changed_hnsw_config(self, mock_chroma_class, mock_agent):
+        """Test new HNSW parameters re-create the collection they are frozen into"""
+        mock_agent._write_index_marker(mock_agent._document_fingerprint())
+
+        mock_vector_store = MagicMock()
+        mock_vector_store.aadd_texts = AsyncMock()
+        mock_chroma_class.return_value = mock_vector_store
+
+        with patch('src.rag.base.HNSW_MAX_NEIGHBORS', 32):
+            await mock_agent.initialize()
+
+        hnsw = mock_chroma_class.call_args.kwargs['collection_configuration']['hnsw']
+        assert hnsw['max_neighbors'] == 32
+        mock_vector_store.reset_collection.assert_called_once()
+        mock_vector_store.aadd_texts.assert_awaited_once()
+
+    @patch('src.rag.base.Chroma')
+    async def test_initialize_reindexes_changed_embedding_dimensions(self, mock_chroma_class, mock_agent):
+        """Test vectors of a different size are not reused"""
+        mock_agent.embeddings.dimensions = 1536
+        mock_agent._write_index_marker(mock_agent._document_fingerprint())
+        mock_agent.embeddings.dimensions = 512
+
+        mock_vector_store = MagicMock()
+        mock_vector_store.aadd_texts = AsyncMock()
+        mock_chroma_class.return_value = mock_vector_store
+
+        await mock_agent.initialize()
+
+        mock_vector_store.reset_collection.assert_called_once()
+        mock_vector_store.aadd_texts.assert_awaited_once()
 
     def test_search_without_initialization(self, mock_agent):
         """Test search before initialization raises error"""
@@ -183,11 +308,9 @@ class TestBaseRAGAgent:
         mock_doc2 = Mock()
         mock_doc2.page_content = "Second document content"
         
+        mock_agent._write_index_marker(mock_agent._document_fingerprint())
         mock_vector_store = MagicMock()
-        mock_collection = MagicMock()
-        mock_collection.count.return_value = 5
-        mock_vector_store._collection = mock_collection
-        mock_vector_store.similarity_search = Mock(return_value=[mock_doc1, mock_doc2])
+        mock_vector_store.max_marginal_relevance_search_by_vector = Mock(return_value=[mock_doc1, mock_doc2])
         mock_chroma_class.return_value = mock_vector_store
         
         await mock_agent.initialize()
@@ -199,15 +322,74 @@ class TestBaseRAGAgent:
         assert "Document excerpt 2" in result
         assert "---" in result  # Separator
 
+    @patch('src.rag.base.Chroma')
+    async def test_search_caches_normalized_query(self, mock_chroma_class, mock_agent):
+        """Test repeated queries are served from the cache"""
+        mock_doc = Mock()
+        mock_doc.page_content = "Cached document content"
+
+        mock_agent._write_index_marker(mock_agent._document_fingerprint())
+        mock_vector_store = MagicMock()
+        mock_vector_store.max_marginal_relevance_search_by_vector = Mock(return_value=[mock_doc])
+        mock_chroma_class.return_value = mock_vector_store
+
+        await mock_agent.initialize()
+        first = mock_agent.search("How do I add a user?")
+        second = mock_agent.search("  how do I\n ADD   a user?  ")
+
+        assert first == second
+        mock_agent.embeddings.embed_query.assert_called_once_with("how do i add a user?")
+        mock_vector_store.max_marginal_relevance_search_by_vector.assert_called_once_with(
+            [0.1] * 768, k=2, fetch_k=20, lambda_mult=0.5
+        )
+
+    @patch('src.rag.base.Chroma')
+    async def test_query_embeddings_survive_reinitialize(self, mock_chroma_class, mock_agent):
+        """Test query vectors are reused after the search cache is cleared"""
+        mock_agent._write_index_marker(mock_agent._document_fingerprint())
+        mock_vector_store = MagicMock()
+        mock_vector_store.max_marginal_relevance_search_by_vector = Mock(return_value=[])
+        mock_chroma_class.return_value = mock_vector_store
+
+        await mock_agent.initialize()
+        mock_agent.search("test query")
+        await mock_agent.initialize()
+        mock_agent.search("test query")
+
+        mock_agent.embeddings.embed_query.assert_called_once_with("test query")
+        assert mock_vector_store.max_marginal_relevance_search_by_vector.call_count == 2
+
+    @patch('src.rag.base.Chroma')
+    async def test_asearch_shares_search_cache(self, mock_chroma_class, mock_agent):
+        """Test async search returns the same cached results as sync search"""
+        mock_doc = Mock()
+        mock_doc.page_content = "Async document content"
+
+        mock_agent._write_index_marker(mock_agent._document_fingerprint())
+        mock_vector_store = MagicMock()
+        mock_vector_store.max_marginal_relevance_search_by_vector = Mock(return_value=[mock_doc])
+        mock_chroma_class.return_value = mock_vector_store
+
+        await mock_agent.initialize()
+        first = await mock_agent.asearch("test query")
+        second = mock_agent.search("test query")
+
+        assert "Async document content" in first
+        assert first == second
+        mock_vector_store.max_marginal_relevance_search_by_vector.assert_called_once()
+
+    async def test_asearch_without_initialization(self, mock_agent):
+        """Test async search fails before initialization"""
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await mock_agent.asearch("test query")
+
     @patch('src.rag.base.Chroma')
     async def test_search_no_results(self, mock_chroma_class, mock_agent):
         """Test search with no results returns appropriate message"""
         # Setup mock vector store with no results
+        mock_agent._write_index_marker(mock_agent._document_fingerprint())
         mock_vector_store = MagicMock()
-        mock_collection = MagicMock()
-        mock_collection.count.return_value = 5
-        mock_vector_store._collection = mock_collection
-        mock_vector_store.similarity_search = Mock(return_value=[])
+        mock_vector_store.max_marginal_relevance_search_by_vector = Mock(return_value=[])
         mock_chroma_class.return_value = mock_vector_store
         
         await mock_agent.initialize()
@@ -219,10 +401,8 @@ class TestBaseRAGAgent:
     async def test_create_tool(self, mock_chroma_class, mock_agent):
         """Test tool creation"""
         # Setup mock
+        mock_agent._write_index_marker(mock_agent._document_fingerprint())
         mock_vector_store = MagicMock()
-        mock_collection = MagicMock()
-        mock_collection.count.return_value = 5
-        mock_vector_store._collection = mock_collection
         mock_chroma_class.return_value = mock_vector_store
         
         await mock_agent.initialize()
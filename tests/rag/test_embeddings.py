@@ -0,0 +1,83 @@
+"""
+Unit tests for concurrent OpenAI embeddings.
+
+Tests batch splitting, result ordering, and bounded concurrency.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+from langchain_openai import OpenAIEmbeddings
+
+from src.rag.embeddings import ConcurrentOpenAIEmbeddings
+
+
+def fake_embed(texts, chunk_size=None, **kwargs):
+    """Embed each text as a one-dimensional vector of its index"""
+    return [[float(text)] for text in texts]
+
+
+class TestConcurrentOpenAIEmbeddings:
+    """Test suite for ConcurrentOpenAIEmbeddings"""
+
+    @pytest.fixture
+    def embeddings(self):
+        """Create embeddings with small batches"""
+        return ConcurrentOpenAIEmbeddings(api_key="test-key", chunk_size=2, max_concurrency=2)
+
+    @pytest.fixture
+    def texts(self):
+        """Texts spanning several batches"""
+        return [str(i) for i in range(7)]
+
+    def test_batches(self, embeddings, texts):
+        """Test texts are split into chunk_size batches"""
+        batches = embeddings._batches(texts, None)
+
+        assert batches == [["0", "1"], ["2", "3"], ["4", "5"], ["6"]]
+        assert embeddings._batches(texts, 5) == [texts[:5], texts[5:]]
+
+    def test_embed_documents_preserves_order(self, embeddings, texts):
+        """Test sync embedding returns one vector per text in input order"""
+        with patch.object(OpenAIEmbeddings, "embed_documents", side_effect=fake_embed) as mock_embed:
+            result = embeddings.embed_documents(texts)
+
+        assert result == [[float(i)] for i in range(7)]
+        assert mock_embed.call_count == 4
+
+    def test_embed_documents_single_batch(self, embeddings):
+        """Test a single batch is passed straight through"""
+        with patch.object(OpenAIEmbeddings, "embed_documents", side_effect=fake_embed) as mock_embed:
+            result = embeddings.embed_documents(["1"])
+
+        assert result == [[1.0]]
+        mock_embed.assert_called_once()
+
+    async def test_aembed_documents_preserves_order(self, embeddings, texts):
+        """Test async embedding returns one vector per text in input order"""
+        async def fake_aembed(batch, chunk_size=None, **kwargs):
+            await asyncio.sleep(0.01 * (len(texts) - int(batch[0])))
+            return fake_embed(batch)
+
+        with patch.object(OpenAIEmbeddings, "aembed_documents", side_effect=fake_aembed):
+            result = await embeddings.aembed_documents(texts)
+
+        assert result == [[float(i)] for i in range(7)]
+
+    async def test_aembed_documents_bounded_concurrency(self, embeddings, texts):
+        """Test no more than max_concurrency requests run at once"""
+        in_flight = 0
+        peak = 0
+
+        async def fake_aembed(batch, chunk_size=None, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return fake_embed(batch)
+
+        with patch.object(OpenAIEmbeddings, "aembed_documents", side_effect=fake_aembed):
+            await embeddings.aembed_documents(texts)
+
+        assert peak == 2
@@ -4,6 +4,7 @@ Unit tests for RAG Agent Registry.
 Tests agent registration, tool creation, and multi-agent coordination.
 """
 
+import asyncio
 import pytest
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -171,6 +172,30 @@ class TestRAGAgentRegistry:
             assert agent2.initialize_called
             assert agent3.initialize_called
 
+    @pytest.mark.asyncio
+    async def test_get_all_tools_initializes_concurrently(self, registry, mock_embeddings):
+        """Test agents are initialized concurrently and tools keep registration order"""
+        in_flight = 0
+        peak = 0
+
+        class SlowRAGAgent(MockRAGAgent):
+            async def initialize(self) -> None:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                await super().initialize()
+
+        with TemporaryDirectory() as tmpdir:
+            for name in ("first", "second", "third"):
+                registry.register(SlowRAGAgent(Path(tmpdir), mock_embeddings, name))
+
+            tools = await registry.get_all_tools()
+
+        assert peak == 3
+        assert [tool.name for tool in tools] == ["search_first", "search_second", "search_third"]
+
     @pytest.mark.asyncio
     async def test_get_all_tools_initializes_agents(self, registry, mock_agent):
         """Test that get_all_tools initializes agents"""